@@ -1,5 +1,22 @@
 # This file exposes the main public API, such as `get_scraper`.
-from .core.models import MovementModel
-from .scrapers import get_scraper
+# Attributes are resolved lazily (PEP 562) so `import fintself` does not pull
+# in Playwright and every bank scraper until they are actually used.
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.models import MovementModel
+    from .scrapers import get_scraper
 
 __all__ = ["get_scraper", "MovementModel"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "get_scraper":
+        from .scrapers import get_scraper
+
+        return get_scraper
+    if name == "MovementModel":
+        from .core.models import MovementModel
+
+        return MovementModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
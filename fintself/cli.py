@@ -1,21 +1,15 @@
+import itertools
 import os
-from getpass import getpass
-from typing import Optional
+import queue
+import sys
+import threading
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
 import typer
 from dotenv import load_dotenv
 
-load_dotenv()
-
 from fintself.core.exceptions import FintselfException
-from fintself.scrapers import get_scraper, list_available_scrapers
 from fintself.utils.logging import logger
-from fintself.utils.output import (
-    get_output_data,
-    save_to_csv,
-    save_to_json,
-    save_to_xlsx,
-)
 
 app = typer.Typer(
     name="fintself",
@@ -24,20 +18,76 @@ app = typer.Typer(
     rich_markup_mode="markdown",
 )
 
+# Output file extensions and the format/saver each one maps to. Savers are
+# named rather than imported so that pandas is only loaded when writing.
+_EXT_TO_FORMAT = {".xlsx": "xlsx", ".csv": "csv", ".json": "json"}
+_FORMAT_TO_SAVER = {
+    "xlsx": "save_to_xlsx",
+    "csv": "save_to_csv",
+    "json": "save_to_json",
+}
+
+# Maps bank IDs to the prefix of their credential env vars (cl-foo -> CL_FOO).
+_BANK_ID_XLATE = str.maketrans("-", "_")
+
+
+def _get_saver(file_format: str) -> Callable[[Iterable[Any], str], None]:
+    """Returns the output function that writes files in the given format."""
+    from fintself.utils import output
+
+    return getattr(output, _FORMAT_TO_SAVER[file_format])
+
+
+def _get_credentials(bank_id: str) -> Tuple[str, str]:
+    """
+    Reads the bank credentials from the environment, prompting if missing.
+
+    Prompts are only shown on an interactive terminal; otherwise missing
+    credentials end the command instead of blocking on input.
+    """
+    bank_key = bank_id.translate(_BANK_ID_XLATE).upper()
+    user_env_var = f"{bank_key}_USER"
+    password_env_var = f"{bank_key}_PASSWORD"
+    user = os.getenv(user_env_var)
+    password = os.getenv(password_env_var)
+    if user and password:
+        return user, password
+
+    if not sys.stdin.isatty():
+        logger.error(
+            f"Missing credentials for {bank_id}. Set {user_env_var} and "
+            f"{password_env_var} when running non-interactively."
+        )
+        raise typer.Exit(code=1)
+
+    from getpass import getpass
+
+    if not user:
+        user = typer.prompt(f"Usuario para {bank_id}")
+    if not password:
+        password = getpass(f"Password for {bank_id}: ")
+    return user, password
+
 
 @app.command(name="list")
 def list_scrapers_command():
     """
     Lists all available bank scrapers.
     """
+    from fintself.scrapers import list_available_scrapers
+
     logger.info("Available bank scrapers:")
     scrapers = list_available_scrapers()
     if not scrapers:
         logger.warning("No available scrapers found.")
         return
 
-    for bank_id, description in scrapers.items():
-        typer.echo(f"- {typer.style(bank_id, fg=typer.colors.GREEN)}: {description}")
+    typer.echo(
+        "\n".join(
+            f"- {typer.style(bank_id, fg=typer.colors.GREEN)}: {description}"
+            for bank_id, description in scrapers.items()
+        )
+    )
 
 
 @app.command(name="scrape")
@@ -90,28 +140,15 @@ def scrape_bank_command(
     if output_file:
         _, ext = os.path.splitext(output_file)
         ext = ext.lower()
-        if ext == ".xlsx":
-            file_format = "xlsx"
-        elif ext == ".csv":
-            file_format = "csv"
-        elif ext == ".json":
-            file_format = "json"
-        else:
+        file_format = _EXT_TO_FORMAT.get(ext)
+        if file_format is None:
             logger.error(
                 f"File extension '{ext}' not supported. Use .xlsx, .csv, or .json."
             )
             raise typer.Exit(code=1)
 
-    user_env_var = f"{bank_id.upper().replace('-', '_')}_USER"
-    password_env_var = f"{bank_id.upper().replace('-', '_')}_PASSWORD"
-
-    user = os.getenv(user_env_var)
-    password = os.getenv(password_env_var)
-
-    if not user:
-        user = typer.prompt(f"Usuario para {bank_id}")
-    if not password:
-        password = getpass(f"Password for {bank_id}: ")
+    load_dotenv()
+    user, password = _get_credentials(bank_id)
 
     try:
         # Warn if headless mode is explicitly enabled
@@ -121,23 +158,24 @@ def scrape_bank_command(
                 "If you encounter issues, try running without --headless (visible mode)."
             )
 
+        from fintself.scrapers import get_scraper
+
         # Pass overrides to scraper factory. If None, settings from .env will be used.
         scraper = get_scraper(bank_id, headless=headless, debug_mode=debug_mode)
-        movements = scraper.scrape(user=user, password=password)
+        movements_iter = scraper.scrape_iter(user=user, password=password)
 
-        if not movements:
+        first = next(movements_iter, None)
+        if first is None:
             logger.info("No movements found.")
             raise typer.Exit(code=0)
+        movements = itertools.chain([first], movements_iter)
 
         if output_file:
-            if file_format == "xlsx":
-                save_to_xlsx(movements, output_file)
-            elif file_format == "csv":
-                save_to_csv(movements, output_file)
-            elif file_format == "json":
-                save_to_json(movements, output_file)
+            _get_saver(file_format)(movements, output_file)
             logger.info(f"Scraping completed. Data saved to {output_file}")
         elif output_format in ["json", "csv"]:
+            from fintself.utils.output import get_output_data
+
             output_data = get_output_data(movements, output_format)
             typer.echo(output_data)
             logger.info("Scraping completed. Data printed to console.")
@@ -147,11 +185,128 @@ def scrape_bank_command(
             )
             raise typer.Exit(code=1)
 
+    except typer.Exit:
+        raise
     except FintselfException as e:
-        logger.error(f"Error en el scraping: {str(e)}")
+        logger.error("Error en el scraping: {}", e)
         raise typer.Exit(code=1)
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}", exc_info=debug_mode)
+        logger.opt(exception=bool(debug_mode)).error(
+            "An unexpected error occurred: {}", e
+        )
+        raise typer.Exit(code=1)
+
+
+@app.command(name="scrape-many")
+def scrape_many_command(
+    bank_ids: List[str] = typer.Argument(
+        ..., help="The bank identifiers to scrape (e.g.: cl_santander cl_banco_chile)."
+    ),
+    output_dir: str = typer.Option(
+        ".",
+        "--output-dir",
+        "-d",
+        help="Directory where one file per bank is written (<bank_id>.<format>).",
+    ),
+    file_format: str = typer.Option(
+        "xlsx",
+        "--format",
+        "-f",
+        help="Output file format. Options: xlsx, csv, json.",
+        case_sensitive=False,
+    ),
+    debug_mode: Optional[bool] = typer.Option(
+        None,
+        "--debug/--no-debug",
+        help="Enable or disable debug mode, overriding .env configuration.",
+        show_default=False,
+    ),
+    headless: Optional[bool] = typer.Option(
+        None,
+        "--headless/--no-headless",
+        help="Run browser in headless mode (may not work properly with some banks) or visible mode, overriding .env configuration.",
+        show_default=False,
+    ),
+    max_concurrency: int = typer.Option(
+        4,
+        "--max-concurrency",
+        "-j",
+        help="Maximum number of banks scraped at the same time.",
+        min=1,
+    ),
+):
+    """
+    Scrapes several banks in one session, in parallel and reusing browsers.
+    """
+    file_format = file_format.lower()
+    if file_format not in _FORMAT_TO_SAVER:
+        logger.error(f"Format '{file_format}' not supported. Use xlsx, csv, or json.")
+        raise typer.Exit(code=1)
+    saver = _get_saver(file_format)
+
+    from fintself.core import browser_pool
+    from fintself.scrapers import get_scraper
+
+    # Ask for every missing credential up front so the run is unattended.
+    load_dotenv()
+    credentials = {bank_id: _get_credentials(bank_id) for bank_id in bank_ids}
+    os.makedirs(output_dir, exist_ok=True)
+
+    jobs: "queue.Queue[str]" = queue.Queue()
+    for bank_id in credentials:
+        jobs.put(bank_id)
+    failed: List[str] = []
+
+    def worker() -> None:
+        # Each worker scrapes banks one after another with its own browser
+        # pool, since sync Playwright objects cannot be shared across threads.
+        try:
+            while True:
+                try:
+                    bank_id = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                user, password = credentials[bank_id]
+                output_file = os.path.join(output_dir, f"{bank_id}.{file_format}")
+                try:
+                    scraper = get_scraper(
+                        bank_id, headless=headless, debug_mode=debug_mode
+                    )
+                    movements_iter = scraper.scrape_iter(user=user, password=password)
+
+                    # Login and the first page are scraped before the output
+                    # file is touched, as in `scrape`, so no empty file is
+                    # written for a bank without movements.
+                    first = next(movements_iter, None)
+                    if first is None:
+                        logger.info(f"No movements found for {bank_id}.")
+                        continue
+                    saver(itertools.chain([first], movements_iter), output_file)
+                    logger.info(
+                        f"Scraping of {bank_id} completed. Data saved to {output_file}"
+                    )
+                except FintselfException as e:
+                    logger.error("Error en el scraping de {}: {}", bank_id, e)
+                    failed.append(bank_id)
+                except Exception as e:
+                    logger.opt(exception=bool(debug_mode)).error(
+                        "An unexpected error occurred scraping {}: {}", bank_id, e
+                    )
+                    failed.append(bank_id)
+        finally:
+            browser_pool.shutdown()
+
+    workers = [
+        threading.Thread(target=worker, name=f"scraper-{i}")
+        for i in range(max(1, min(max_concurrency, len(credentials))))
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    if failed:
+        logger.error(f"Scraping failed for: {', '.join(failed)}")
         raise typer.Exit(code=1)
 
 
@@ -0,0 +1,161 @@
+"""
+Process-wide pool of Playwright browsers shared across scrape invocations.
+
+Launching Chromium costs around a second per scrape. The pool keeps the
+Playwright driver and idle browsers alive between scrapes so that several
+banks scraped in one session (e.g. ``fintself scrape-many``) only pay that
+cost once. Each scrape still gets its own isolated browser context, so no
+cookies or storage leak from one bank to the next.
+
+The sync Playwright API is bound to the thread that started it, so the pool
+is kept per thread. The pool of the main thread is shut down at interpreter
+exit; other threads must call :func:`shutdown` before they finish. This
+includes executor threads (e.g. those of ``asyncio.to_thread``), which are
+reused and would otherwise keep their driver and browsers alive.
+
+``SCRAPER_POOL_SIZE`` caps how many idle browsers are kept per launch
+configuration, and ``SCRAPER_MAX_USES_PER_INSTANCE`` recycles a browser after
+that many scrapes (0 disables recycling).
+"""
+
+import atexit
+import queue
+import threading
+from typing import Dict, Optional, Tuple
+
+from playwright.sync_api import Browser, Playwright, sync_playwright
+
+from fintself import settings
+from fintself.utils.logging import logger
+
+# (headless, slow_mo) -> idle browsers launched with those options.
+_PoolKey = Tuple[bool, int]
+
+_local = threading.local()
+
+
+class _ThreadPool:
+    """Playwright driver and idle browsers owned by a single thread."""
+
+    def __init__(self) -> None:
+        self.playwright: Optional[Playwright] = None
+        self.idle: Dict[_PoolKey, "queue.LifoQueue[Browser]"] = {}
+        self.keys: Dict[Browser, _PoolKey] = {}
+        self.uses: Dict[Browser, int] = {}
+
+
+def _get_pool() -> _ThreadPool:
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = _local.pool = _ThreadPool()
+    return pool
+
+
+def _close(pool: _ThreadPool, browser: Browser) -> None:
+    """Closes a browser and forgets it."""
+    pool.keys.pop(browser, None)
+    pool.uses.pop(browser, None)
+    try:
+        browser.close()
+    except Exception as e:
+        logger.debug(f"Could not close browser: {e}")
+
+
+def acquire(headless: bool, slow_mo: int = 0) -> Browser:
+    """
+    Returns a Chromium browser launched with the given options, reusing an
+    idle one from the pool when available.
+
+    Args:
+        headless (bool): Whether the browser runs without a graphical interface.
+        slow_mo (int): Delay in milliseconds applied to every Playwright action.
+
+    Returns:
+        Browser: A connected browser. Hand it back with :func:`release`.
+    """
+    pool = _get_pool()
+    key = (headless, slow_mo)
+    idle = pool.idle.setdefault(key, queue.LifoQueue())
+
+    while True:
+        try:
+            browser = idle.get_nowait()
+        except queue.Empty:
+            break
+        if browser.is_connected():
+            logger.debug(f"Reusing pooled browser (headless: {headless}).")
+            pool.uses[browser] += 1
+            return browser
+        _close(pool, browser)
+
+    if pool.playwright is None:
+        pool.playwright = sync_playwright().start()
+
+    # Size the window to the context viewport so no extra pixels are
+    # composited, and skip GPU initialization when nothing is displayed.
+    args = [
+        f"--window-size={settings.SCRAPER_VIEWPORT_WIDTH},"
+        f"{settings.SCRAPER_VIEWPORT_HEIGHT}"
+    ]
+    if headless:
+        args.append("--disable-gpu")
+
+    browser = pool.playwright.chromium.launch(
+        headless=headless, slow_mo=slow_mo, args=args
+    )
+    pool.keys[browser] = key
+    pool.uses[browser] = 1
+    return browser
+
+
+def release(browser: Browser, discard: bool = False) -> None:
+    """
+    Returns a browser to the pool after closing any context left open on it.
+
+    The browser is closed instead of pooled when ``discard`` is True (e.g.
+    after a failed scrape), when it is disconnected or was not obtained from
+    :func:`acquire` in this thread, when it reached the maximum number of
+    uses, or when the pool already holds enough idle browsers.
+    """
+    pool = _get_pool()
+    key = pool.keys.get(browser)
+    max_uses = settings.SCRAPER_MAX_USES_PER_INSTANCE
+
+    if (
+        discard
+        or key is None
+        or not browser.is_connected()
+        or (max_uses > 0 and pool.uses[browser] >= max_uses)
+        or pool.idle[key].qsize() >= settings.SCRAPER_POOL_SIZE
+    ):
+        _close(pool, browser)
+        return
+
+    for context in list(browser.contexts):
+        try:
+            context.close()
+        except Exception as e:
+            logger.debug(f"Could not close browser context: {e}")
+    pool.idle[key].put(browser)
+
+
+def shutdown() -> None:
+    """Closes all pooled browsers of the current thread and stops Playwright."""
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        return
+
+    for browser in list(pool.keys):
+        _close(pool, browser)
+    pool.idle.clear()
+
+    if pool.playwright is not None:
+        try:
+            pool.playwright.stop()
+        except Exception as e:
+            logger.debug(f"Could not stop Playwright: {e}")
+        pool.playwright = None
+        logger.debug("Browser pool shut down.")
+
+
+atexit.register(shutdown)
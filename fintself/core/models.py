@@ -1,16 +1,50 @@
 import re
 from datetime import datetime
 from decimal import Decimal
-from typing import Literal, Optional
+from typing import Any, Literal, Optional, get_args
 
 from pydantic import BaseModel, Field, field_validator
 
 AccountType = Literal["corriente", "credito", "debito", "prepago"]
+_ACCOUNT_TYPES = frozenset(get_args(AccountType))
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def _normalize_account_id(v: Any) -> Optional[str]:
+    """Reduces an account identifier to its last 4 digits."""
+    if v is None:
+        return None
+    # Remove all non-digit characters
+    digits = _NON_DIGITS.sub("", str(v))
+    if len(digits) >= 4:
+        return digits[-4:]
+    # Return whatever is left if less than 4 digits, or the original if no digits found
+    return digits if digits else v
 
 
 class MovementModel(BaseModel):
     """
     Pydantic model to represent a bank movement.
+
+    Scrapers should create instances with `MovementModel.build`, which skips
+    validation for values they have already parsed. The regular constructor
+    keeps full validation for data coming from outside the library.
+
+    Example (as JSON):
+        {
+            "date": "2023-10-26T10:00:00",
+            "description": "Compra en Supermercado",
+            "amount": "-15000.00",
+            "currency": "CLP",
+            "transaction_type": "Cargo",
+            "account_id": "5678",
+            "account_type": "credito",
+            "raw_data": {
+                "original_desc": "COMPRA SUPERMERCADO LIDER",
+                "full_account_id": "1234-5678"
+            }
+        }
     """
 
     date: datetime = Field(..., description="Date of the movement.")
@@ -39,28 +73,26 @@ class MovementModel(BaseModel):
     @classmethod
     def _format_account_id(cls, v: Optional[str]) -> Optional[str]:
         """Ensures the account_id is only the last 4 digits."""
-        if v is None:
-            return None
-        # Remove all non-digit characters
-        digits = re.sub(r"\D", "", str(v))
-        if len(digits) >= 4:
-            return digits[-4:]
-        # Return whatever is left if less than 4 digits, or the original if no digits found
-        return digits if digits else v
+        return _normalize_account_id(v)
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "date": "2023-10-26T10:00:00",
-                "description": "Compra en Supermercado",
-                "amount": "-15000.00",
-                "currency": "CLP",
-                "transaction_type": "Cargo",
-                "account_id": "5678",
-                "account_type": "credito",
-                "raw_data": {
-                    "original_desc": "COMPRA SUPERMERCADO LIDER",
-                    "full_account_id": "1234-5678",
-                },
-            }
-        }
+    @classmethod
+    def build(cls, **kwargs: Any) -> "MovementModel":
+        """Creates a movement from trusted, already-parsed scraper values.
+
+        This bypasses pydantic validation, so every value must already have
+        its declared type (e.g. `datetime` for `date`, `Decimal` for `amount`).
+        The account ID is still reduced to its last 4 digits.
+
+        Args:
+            **kwargs: The model fields.
+
+        Returns:
+            MovementModel: The constructed movement.
+        """
+        if "account_id" in kwargs:
+            kwargs["account_id"] = cls._format_account_id(kwargs["account_id"])
+        account_type = kwargs.get("account_type")
+        assert account_type is None or account_type in _ACCOUNT_TYPES, (
+            f"Invalid account_type: {account_type!r}"
+        )
+        return cls.model_construct(**kwargs)
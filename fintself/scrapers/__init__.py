@@ -1,24 +1,44 @@
-from typing import Dict, Optional, Type
+import functools
+import importlib
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type
 
 from fintself.core.exceptions import ScraperNotFound
-from fintself.scrapers.base import BaseScraper
 from fintself.utils.logging import logger
 
-# Import specific scrapers here so the factory can find them
-from .cl import BancoChileScraper, BancoEstadoScraper, CencosudScraper, SantanderScraper
+if TYPE_CHECKING:
+    from fintself.scrapers.base import BaseScraper
 
-# Dictionary that maps bank IDs to scraper classes
-_SCRAPERS: Dict[str, Type[BaseScraper]] = {
-    "cl_santander": SantanderScraper,
-    "cl_cencosud": CencosudScraper,
-    "cl_banco_chile": BancoChileScraper,
-    "cl_estado": BancoEstadoScraper,
+# Dictionary that maps bank IDs to the module and class of each scraper.
+# Scraper modules (and Playwright) are only imported when a scraper is requested.
+_SCRAPERS: Dict[str, Tuple[str, str]] = {
+    "cl_santander": ("fintself.scrapers.cl.santander", "SantanderScraper"),
+    "cl_cencosud": ("fintself.scrapers.cl.cencosud", "CencosudScraper"),
+    "cl_banco_chile": ("fintself.scrapers.cl.banco_chile", "BancoChileScraper"),
+    "cl_estado": ("fintself.scrapers.cl.estado", "BancoEstadoScraper"),
 }
 
+# Scraper classes already resolved in this process, by bank ID.
+_scraper_classes: Dict[str, Type["BaseScraper"]] = {}
+
+
+def _load_scraper_class(bank_id: str) -> Optional[Type["BaseScraper"]]:
+    """Imports and returns the scraper class for a bank ID, if registered."""
+    scraper_class = _scraper_classes.get(bank_id)
+    if scraper_class is not None:
+        return scraper_class
+
+    entry = _SCRAPERS.get(bank_id)
+    if entry is None:
+        return None
+    module_name, class_name = entry
+    scraper_class = getattr(importlib.import_module(module_name), class_name)
+    _scraper_classes[bank_id] = scraper_class
+    return scraper_class
+
 
 def get_scraper(
     bank_id: str, headless: Optional[bool] = None, debug_mode: Optional[bool] = None
-) -> BaseScraper:
+) -> "BaseScraper":
     """
     Factory function to get a bank scraper instance.
 
@@ -36,7 +56,7 @@ def get_scraper(
     Raises:
         ScraperNotFound: If the bank_id does not match any known scraper.
     """
-    scraper_class = _SCRAPERS.get(bank_id)
+    scraper_class = _load_scraper_class(bank_id)
     if not scraper_class:
         logger.error(f"Scraper '{bank_id}' not found.")
         raise ScraperNotFound(bank_id)
@@ -48,10 +68,14 @@ def get_scraper(
     return scraper_class(headless=headless, debug_mode=debug_mode)
 
 
+@functools.cache
 def list_available_scrapers() -> Dict[str, str]:
     """
     Lists all available bank scrapers.
 
+    The result is computed once per process and shared between callers, so
+    it must not be modified.
+
     Returns:
         Dict[str, str]: A dictionary where the key is the bank_id and the value is a description.
     """
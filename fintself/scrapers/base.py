@@ -1,26 +1,57 @@
+import asyncio
 import datetime
+import gzip
+import hashlib
+import json
 import os
 import random
+import re
+import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional, Union
-
-from playwright.sync_api import (
-    Browser,
-    Locator,
-    Page,
-    Playwright,
-    sync_playwright,
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
 )
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser, BrowserContext, Locator, Page, Route
 from playwright.sync_api import (
     TimeoutError as PlaywrightTimeoutError,
 )
 
 from fintself import settings
+from fintself.core import browser_pool
 from fintself.core.exceptions import DataExtractionError, LoginError
 from fintself.core.models import MovementModel
 from fintself.utils.logging import logger
 
+# Reads the inner text of each named cell selector, relative to every row.
+# A column may list several selectors, tried in order. Cells that are missing
+# come back as null.
+_EXTRACT_TABLE_SCRIPT = """(rows, columns) => rows.map((row) => {
+    const record = {};
+    for (const [name, selectors] of Object.entries(columns)) {
+        let cell = null;
+        for (const selector of [].concat(selectors)) {
+            cell = row.querySelector(selector);
+            if (cell) break;
+        }
+        record[name] = cell ? cell.innerText.trim() : null;
+    }
+    return record;
+})"""
+
 
 class BaseScraper(ABC):
     """
@@ -28,6 +59,27 @@ class BaseScraper(ABC):
     It defines the common interface for authentication and data extraction.
     """
 
+    # Script injected into every page before any site script runs. It hides
+    # the automation flag that bank sites use to detect bots. Subclasses may
+    # extend it.
+    INIT_SCRIPT = (
+        "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+    )
+
+    # Requests aborted in every page since they never carry movement data.
+    # Subclasses can override these if a bank site needs any of them.
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+    BLOCKED_HOSTS = re.compile(
+        r"(^|\.)(google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+        r"|hotjar\.com|clarity\.ms|facebook\.net|nr-data\.net|segment\.io"
+        r"|adobedtm\.com)$"
+    )
+
+    # Selector strings that `_fill` types key by key instead of filling in one
+    # call, for inputs whose scripts listen to every keystroke. Locators are
+    # never matched against it; use `_type` for them.
+    TYPE_REALISTICALLY: FrozenSet[str] = frozenset()
+
     def __init__(
         self,
         headless: Optional[bool] = None,
@@ -60,8 +112,10 @@ class BaseScraper(ABC):
         self.timezone_id = settings.SCRAPER_TIMEZONE_ID
         self.min_human_delay_ms = settings.SCRAPER_MIN_HUMAN_DELAY_MS
         self.max_human_delay_ms = settings.SCRAPER_MAX_HUMAN_DELAY_MS
+        self.human_delay_disabled = settings.SCRAPER_HUMAN_DELAY_DISABLED
+        self._pending_delay_until = 0.0
+        self.type_delay_ms = settings.SCRAPER_TYPE_DELAY_MS
 
-        self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
         self.user: Optional[str] = None
@@ -77,11 +131,130 @@ class BaseScraper(ABC):
         """Implements the bank-specific login logic."""
         pass
 
+    def _probe_logged_in(self) -> bool:
+        """
+        Checks whether a restored session is still logged in.
+
+        Called instead of `_login` when a saved session state was loaded
+        (see ``SCRAPER_STATE_DIR``). Scrapers that support session reuse
+        override it, usually by opening a private page and checking for an
+        element only shown to logged-in users. The default always logs in.
+        """
+        return False
+
+    def _storage_state_path(self) -> Optional[str]:
+        """
+        Returns the file where this bank and user's session is saved, or None
+        if session reuse is disabled or the scraper does not implement
+        `_probe_logged_in`, since such a session could never be reused.
+        """
+        if not settings.SCRAPER_STATE_DIR or not self.user:
+            return None
+        if type(self)._probe_logged_in is BaseScraper._probe_logged_in:
+            return None
+        # Hash the user so that the RUT does not end up in file names.
+        user_hash = hashlib.sha256(self.user.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(
+            settings.SCRAPER_STATE_DIR, f"{self._get_bank_id()}_{user_hash}.json"
+        )
+
+    def _load_storage_state(self, path: Optional[str]) -> Optional[str]:
+        """Returns ``path`` if it holds a session saved within the TTL."""
+        if path is None:
+            return None
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            return None
+        if age > settings.SCRAPER_STATE_TTL_SECONDS:
+            logger.debug(f"Saved session for {self._get_bank_id()} expired.")
+            self._discard_storage_state(path)
+            return None
+        return path
+
+    def _save_storage_state(self, context: BrowserContext, path: str) -> None:
+        """Saves the context's cookies and storage so later scrapes can reuse them."""
+        tmp_path = None
+        try:
+            state = context.storage_state()
+            state_dir = os.path.dirname(path)
+            os.makedirs(state_dir, exist_ok=True)
+            # Written to a temporary file and then renamed over the old one, so
+            # an interrupted save never leaves a truncated session behind.
+            # mkstemp creates it readable by the owner only, as the state
+            # holds live session cookies.
+            fd, tmp_path = tempfile.mkstemp(
+                dir=state_dir, prefix=".tmp-", suffix=".json"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            tmp_path = None
+            logger.debug(f"Session for {self._get_bank_id()} saved to {path}.")
+        except Exception as e:
+            logger.warning(f"Could not save session for {self._get_bank_id()}: {e}")
+        finally:
+            if tmp_path is not None:
+                self._discard_storage_state(tmp_path)
+
+    def _discard_storage_state(self, path: str) -> None:
+        """Deletes a saved session that can no longer be used."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     @abstractmethod
-    def _scrape_movements(self) -> List[MovementModel]:
-        """Implements the bank-specific movement extraction logic."""
+    def _scrape_movements(self) -> Iterable[MovementModel]:
+        """Implements the bank-specific movement extraction logic.
+
+        Implementations may return a list or be generators that yield
+        movements as soon as they are parsed.
+        """
         pass
 
+    def _route_filter(self, route: Route) -> None:
+        """Aborts requests for blocked resource types or tracking hosts."""
+        request = route.request
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES or (
+            self.BLOCKED_HOSTS.search(urlsplit(request.url).hostname or "")
+        ):
+            route.abort()
+        else:
+            route.continue_()
+
+    def _extract_table(
+        self, row_selector: str, columns: Mapping[str, Union[str, Sequence[str]]]
+    ) -> List[Dict[str, Optional[str]]]:
+        """Reads the text of a whole table in a single browser round-trip.
+
+        Args:
+            row_selector: Selector matching every row to read.
+            columns: Mapping of column name to a CSS selector for its cell,
+                relative to the row, or to several selectors tried in order.
+
+        Returns:
+            One dict per row with the trimmed text of each column, or None
+            where the row has no such cell.
+        """
+        page = self._ensure_page()
+        return page.locator(row_selector).evaluate_all(_EXTRACT_TABLE_SCRIPT, columns)
+
+    @staticmethod
+    def _movements_from_records(
+        records: Iterable[Dict[str, Any]],
+    ) -> List[MovementModel]:
+        """Builds movements from already-parsed field dictionaries in one pass.
+
+        Records go through `MovementModel.build`, so their values must already
+        have their final types (as returned by the parsers in
+        `fintself.utils.parsers`).
+        """
+        build = MovementModel.build
+        return [build(**record) for record in records]
+
     def _ensure_page(self) -> Page:
         """Ensures the page object is initialized, raising an error if not."""
         if not self.page:
@@ -94,8 +267,18 @@ class BaseScraper(ABC):
         self,
         min_override_ms: Optional[float] = None,
         max_override_ms: Optional[float] = None,
+        *,
+        defer: bool = False,
     ) -> None:
-        """Waits for a random time to simulate human behavior."""
+        """Waits for a random time to simulate human behavior.
+
+        With ``defer=True`` the pause is not slept right away. It only has
+        to have elapsed before the next interaction (see
+        `_settle_human_delay`), so page loads and selector waits in between
+        count towards it.
+        """
+        if self.human_delay_disabled:
+            return
         min_d = (
             min_override_ms if min_override_ms is not None else self.min_human_delay_ms
         )
@@ -107,19 +290,55 @@ class BaseScraper(ABC):
         delay_seconds = random.uniform(
             min(min_d, max_d) / 1000.0, max(min_d, max_d) / 1000.0
         )
+        if defer:
+            self._pending_delay_until = max(
+                self._pending_delay_until, time.monotonic() + delay_seconds
+            )
+            return
         logger.trace(f"Applying human delay: {delay_seconds:.3f} seconds.")
         time.sleep(delay_seconds)
 
-    def _navigate(self, url: str, timeout_override: Optional[int] = None) -> None:
-        """Navigates to a URL with error handling and human-like delay."""
+    def _settle_human_delay(self) -> None:
+        """Sleeps whatever is left of the last deferred human delay."""
+        remaining = self._pending_delay_until - time.monotonic()
+        if remaining > 0:
+            logger.trace(f"Applying human delay: {remaining:.3f} seconds.")
+            time.sleep(remaining)
+
+    def _navigate(
+        self,
+        url: str,
+        timeout_override: Optional[int] = None,
+        *,
+        wait_until: Literal[
+            "commit", "domcontentloaded", "load", "networkidle"
+        ] = "load",
+        wait_for: Optional[str] = None,
+    ) -> None:
+        """Navigates to a URL with error handling and human-like delay.
+
+        Args:
+            url: The URL to open.
+            timeout_override: Optional timeout in milliseconds, applied to the
+                navigation and to the ``wait_for`` selector.
+            wait_until: Navigation event to wait for. Use ``"commit"`` together
+                with ``wait_for`` to continue as soon as the page is usable
+                instead of waiting for every subresource to load.
+            wait_for: Optional selector that must become visible before the
+                page is considered ready.
+        """
         page = self._ensure_page()
         timeout = (
             timeout_override if timeout_override is not None else self.default_timeout
         )
-        logger.debug(f"Navigating to {url} with timeout {timeout}ms.")
+        logger.debug(
+            f"Navigating to {url} (wait_until: {wait_until}) with timeout {timeout}ms."
+        )
         try:
-            page.goto(url, timeout=timeout)
-            self._human_delay()
+            page.goto(url, timeout=timeout, wait_until=wait_until)
+            if wait_for is not None:
+                page.locator(wait_for).first.wait_for(state="visible", timeout=timeout)
+            self._human_delay(defer=True)
         except PlaywrightTimeoutError as e:
             logger.error(f"Timeout navigating to {url}: {e}")
             raise DataExtractionError(f"Timeout navigating to {url}")
@@ -161,6 +380,7 @@ class BaseScraper(ABC):
                     f"Unable to scroll '{str(selector)}' into view before clicking."
                 )
 
+            self._settle_human_delay()
             effective_force = force
             perform_hover = not (skip_hover or effective_force)
 
@@ -190,7 +410,7 @@ class BaseScraper(ABC):
                 else:
                     raise click_error
 
-            self._human_delay()
+            self._human_delay(defer=True)
         except PlaywrightTimeoutError as e:
             logger.error(f"Timeout clicking selector '{str(selector)}': {e}")
             raise DataExtractionError(f"Timeout clicking selector '{str(selector)}'")
@@ -208,21 +428,37 @@ class BaseScraper(ABC):
         delay: int = 50,
         timeout_override: Optional[int] = None,
     ) -> None:
-        """Fills an input by clearing it and then typing character by character."""
+        """Fills an input with a single ``fill`` call.
+
+        Selector strings listed in ``TYPE_REALISTICALLY`` are instead cleared
+        and typed character by character, for inputs that react to each
+        keystroke. A Locator is always filled in one call, since it cannot be
+        matched against that set; pass such inputs to `_type` instead.
+        """
         page = self._ensure_page()
         timeout = (
             timeout_override if timeout_override is not None else self.default_timeout
         )
+        type_realistically = (
+            isinstance(selector, str) and selector in self.TYPE_REALISTICALLY
+        )
+        if type_realistically and self.type_delay_ms is not None:
+            delay = self.type_delay_ms
         logger.debug(
-            f"Filling selector '{str(selector)}' by typing with delay {delay}ms."
+            f"Filling selector '{str(selector)}'"
+            + (f" by typing with delay {delay}ms." if type_realistically else ".")
         )
         try:
             element = page.locator(selector) if isinstance(selector, str) else selector
             element.first.wait_for(state="visible", timeout=timeout)
-            # Clear the input first, then type to simulate human behavior.
-            element.first.fill("", timeout=timeout)
-            element.first.type(text, delay=delay, timeout=timeout)
-            self._human_delay()
+            self._settle_human_delay()
+            if type_realistically:
+                # Clear the input first, then type to simulate human behavior.
+                element.first.fill("", timeout=timeout)
+                element.first.type(text, delay=delay, timeout=timeout)
+            else:
+                element.first.fill(text, timeout=timeout)
+            self._human_delay(defer=True)
         except PlaywrightTimeoutError as e:
             logger.error(f"Timeout filling selector '{str(selector)}': {e}")
             raise DataExtractionError(f"Timeout filling selector '{str(selector)}'")
@@ -245,12 +481,15 @@ class BaseScraper(ABC):
         timeout = (
             timeout_override if timeout_override is not None else self.default_timeout
         )
+        if self.type_delay_ms is not None:
+            delay = self.type_delay_ms
         logger.debug(f"Typing into selector '{str(selector)}'.")
         try:
             element = page.locator(selector) if isinstance(selector, str) else selector
             element.first.wait_for(state="visible", timeout=timeout)
+            self._settle_human_delay()
             element.first.type(text, delay=delay, timeout=timeout)
-            self._human_delay()
+            self._human_delay(defer=True)
         except PlaywrightTimeoutError as e:
             logger.error(f"Timeout typing into selector '{str(selector)}': {e}")
             raise DataExtractionError(f"Timeout typing into selector '{str(selector)}'")
@@ -294,7 +533,7 @@ class BaseScraper(ABC):
             )
 
     def _save_debug_info(self, step_name: str) -> None:
-        """Saves a screenshot and the current page's HTML for debugging."""
+        """Saves a JPEG screenshot and the gzipped HTML of the current page."""
         if not self.debug_mode or not self.page:
             return
 
@@ -303,18 +542,40 @@ class BaseScraper(ABC):
         debug_path = os.path.join(self.debug_dir, bank_id)
         os.makedirs(debug_path, exist_ok=True)
 
-        screenshot_path = os.path.join(debug_path, f"{timestamp}_{step_name}.png")
-        html_path = os.path.join(debug_path, f"{timestamp}_{step_name}.html")
+        screenshot_path = os.path.join(debug_path, f"{timestamp}_{step_name}.jpg")
+        html_path = os.path.join(debug_path, f"{timestamp}_{step_name}.html.gz")
+
+        # Compress and write the HTML on another thread while the screenshot
+        # is taken; the Playwright calls themselves must stay on this thread.
+        writer = None
+        try:
+            html = self.page.content()
+            writer = threading.Thread(
+                target=self._write_debug_html, args=(html_path, html, step_name)
+            )
+            writer.start()
+        except Exception as e:
+            logger.warning(f"Could not save HTML for {step_name}: {e}")
 
         try:
-            self.page.screenshot(path=screenshot_path, full_page=True)
+            self.page.screenshot(
+                path=screenshot_path,
+                type="jpeg",
+                quality=70,
+                full_page=settings.SCRAPER_DEBUG_FULLPAGE,
+            )
             logger.debug(f"Screenshot saved to: {screenshot_path}")
         except Exception as e:
             logger.warning(f"Could not save screenshot for {step_name}: {e}")
 
+        if writer is not None:
+            writer.join()
+
+    @staticmethod
+    def _write_debug_html(html_path: str, html: str, step_name: str) -> None:
         try:
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(self.page.content())
+            with gzip.open(html_path, "wt", encoding="utf-8") as f:
+                f.write(html)
             logger.debug(f"HTML saved to: {html_path}")
         except Exception as e:
             logger.warning(f"Could not save HTML for {step_name}: {e}")
@@ -324,58 +585,119 @@ class BaseScraper(ABC):
         Executes the entire scraping process: starts the browser,
         logs in, and extracts the data.
         """
+        return list(self.scrape_iter(user, password))
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Closes the browsers and the Playwright driver kept alive between
+        scrapes in the current thread.
+
+        This runs automatically at interpreter exit for the main thread; call
+        it explicitly to free them earlier or from other threads.
+        """
+        browser_pool.shutdown()
+
+    async def scrape_async(self, user: str, password: str) -> List[MovementModel]:
+        """
+        Async counterpart of `scrape`, so several banks can be scraped
+        concurrently with `asyncio.gather`.
+
+        The scrape runs on a worker thread with its own browser pool, which
+        is shut down when the scrape finishes.
+        """
+        return await asyncio.to_thread(self._scrape_in_worker, user, password)
+
+    def _scrape_in_worker(self, user: str, password: str) -> List[MovementModel]:
+        # asyncio.to_thread runs this on a reused executor thread, and only
+        # the main thread's pool is shut down at exit. Shutting down on every
+        # path keeps idle executor threads from holding on to a Playwright
+        # driver and its Chromium processes.
+        try:
+            return self.scrape(user, password)
+        finally:
+            self.shutdown()
+
+    def scrape_iter(self, user: str, password: str) -> Iterator[MovementModel]:
+        """
+        Executes the scraping process lazily, yielding movements as they are
+        extracted. The browser is handed back to the shared browser pool once
+        the iterator is exhausted or closed.
+        """
         self.user = user
         self.password = password
 
-        with sync_playwright() as p:
-            self.playwright = p
-            try:
-                logger.info(
-                    f"Launching browser for {self._get_bank_id()} (headless: {self.headless})..."
-                )
-                self.browser = self.playwright.chromium.launch(
-                    headless=self.headless, slow_mo=self.slow_mo
-                )
-
-                context_options = {
-                    "user_agent": self.user_agent,
-                    "viewport": self.viewport,
-                    "locale": self.locale,
-                    "timezone_id": self.timezone_id,
-                }
-                context = self.browser.new_context(**context_options)
-                context.add_init_script(
-                    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-                )
-                self.page = context.new_page()
-                self.page.set_default_timeout(self.default_timeout)
+        failed = False
+        try:
+            logger.info(
+                f"Acquiring browser for {self._get_bank_id()} (headless: {self.headless})..."
+            )
+            self.browser = browser_pool.acquire(
+                headless=self.headless, slow_mo=self.slow_mo
+            )
 
+            context_options = {
+                "user_agent": self.user_agent,
+                "viewport": self.viewport,
+                "locale": self.locale,
+                "timezone_id": self.timezone_id,
+                # Contexts are ephemeral, so a service worker only adds a hop
+                # to every request without ever serving from its cache.
+                "service_workers": "block",
+                "accept_downloads": False,
+            }
+            state_path = self._storage_state_path()
+            saved_state = self._load_storage_state(state_path)
+            if saved_state is not None:
+                context_options["storage_state"] = saved_state
+            context = self.browser.new_context(**context_options)
+            context.add_init_script(self.INIT_SCRIPT)
+            context.route("**/*", self._route_filter)
+            self.page = context.new_page()
+            self.page.set_default_timeout(self.default_timeout)
+
+            if saved_state is not None and self._probe_logged_in():
+                logger.info(f"Reusing saved session for {self._get_bank_id()}.")
+            else:
+                if saved_state is not None:
+                    logger.info(
+                        f"Saved session for {self._get_bank_id()} is no longer valid."
+                    )
+                    self._discard_storage_state(saved_state)
                 logger.info(f"Logging into {self._get_bank_id()}...")
                 self._login()
                 logger.info(f"Successfully logged into {self._get_bank_id()}.")
+                if state_path is not None:
+                    self._save_storage_state(context, state_path)
+
+            logger.info(f"Extracting movements from {self._get_bank_id()}...")
+            count = 0
+            for movement in self._scrape_movements():
+                count += 1
+                yield movement
+            logger.info(
+                f"Extraction of {count} movements completed for {self._get_bank_id()}."
+            )
 
-                logger.info(f"Extracting movements from {self._get_bank_id()}...")
-                movements = self._scrape_movements()
-                logger.info(
-                    f"Extraction of {len(movements)} movements completed for {self._get_bank_id()}."
-                )
-
-                return movements
-
-            except (LoginError, DataExtractionError):
-                if self.page:
-                    self._save_debug_info("scraping_error")
-                raise
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error during scraping for {self._get_bank_id()}: {e}",
-                    exc_info=True,
-                )
-                if self.page:
-                    self._save_debug_info("unexpected_error")
-                raise
-            finally:
-                if self.browser:
-                    self.browser.close()
-                    logger.info(f"Browser closed for {self._get_bank_id()}.")
-        return []
+        except (LoginError, DataExtractionError):
+            failed = True
+            if self.page:
+                self._save_debug_info("scraping_error")
+            raise
+        except Exception as e:
+            failed = True
+            logger.error(
+                f"Unexpected error during scraping for {self._get_bank_id()}: {e}",
+                exc_info=True,
+            )
+            if self.page:
+                self._save_debug_info("unexpected_error")
+            raise
+        finally:
+            # Releasing closes the scrape's context, so no session survives.
+            # A browser that saw an error is discarded rather than reused.
+            if self.browser:
+                browser_pool.release(self.browser, discard=failed)
+                logger.info(f"Browser released for {self._get_bank_id()}.")
+            self.browser = None
+            self.page = None
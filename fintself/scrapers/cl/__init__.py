@@ -1,10 +1,15 @@
 # This file makes the 'cl' directory a Python package.
 # It exposes scrapers from this country so they can be imported from other modules.
+# Scrapers are resolved lazily (PEP 562), so importing one bank's module does
+# not import the others.
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .banco_chile import BancoChileScraper
-from .cencosud import CencosudScraper
-from .estado import BancoEstadoScraper
-from .santander import SantanderScraper
+if TYPE_CHECKING:
+    from .banco_chile import BancoChileScraper
+    from .cencosud import CencosudScraper
+    from .estado import BancoEstadoScraper
+    from .santander import SantanderScraper
 
 __all__ = [
     "BancoChileScraper",
@@ -12,3 +17,17 @@ __all__ = [
     "CencosudScraper",
     "SantanderScraper",
 ]
+
+_SCRAPER_MODULES = {
+    "BancoChileScraper": ".banco_chile",
+    "BancoEstadoScraper": ".estado",
+    "CencosudScraper": ".cencosud",
+    "SantanderScraper": ".santander",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _SCRAPER_MODULES.get(name)
+    if module_name is not None:
+        return getattr(importlib.import_module(module_name, __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
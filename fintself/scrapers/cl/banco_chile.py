@@ -1,8 +1,10 @@
+import functools
 import re
-from typing import List, Optional
+import sys
+from typing import List, Optional, Sequence
 
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from playwright.sync_api import expect, Locator
+from playwright.sync_api import Locator
 
 from fintself.core.exceptions import DataExtractionError, LoginError
 from fintself.core.models import MovementModel
@@ -10,6 +12,34 @@ from fintself.scrapers.base import BaseScraper
 from fintself.utils.logging import logger
 from fintself.utils.parsers import parse_chilean_amount, parse_chilean_date
 
+# Currency code in a currency option label, e.g. "Dólar (USD)".
+_CURRENCY_CODE = re.compile(r"\((.*?)\)")
+_ACCOUNT_ID_PATTERNS = (
+    re.compile(r"([\d-]+)"),  # Original pattern
+    re.compile(r"(\d{2}-\d{3}-\d{5}-\d{2})"),  # Specific Chilean account format
+    re.compile(r"(\d+)"),  # Just numbers
+)
+
+# True once the paginator label shows a range other than the given one and the
+# table has rows again, i.e. the next page of movements is ready to be read.
+_NEXT_PAGE_READY_SCRIPT = """([labelSelector, oldText, rowSelector]) => {
+    const label = document.querySelector(labelSelector);
+    return label !== null && label.innerText !== oldText &&
+        document.querySelector(rowSelector) !== null;
+}"""
+
+# True once the account radios are shown and no loading spinner is left, i.e.
+# the accounts of the selected currency have been rendered.
+_ACCOUNTS_READY_SCRIPT = """() =>
+    document.querySelector("mat-radio-button") !== null &&
+    document.querySelector("mat-spinner, mat-progress-spinner, .mat-progress-spinner") === null"""
+
+# Whether a radio button (a mat-radio-button or a plain input) is selected.
+_RADIO_CHECKED_SCRIPT = """el => {
+    const input = el.matches("input") ? el : el.querySelector("input[type=radio]");
+    return input ? input.checked : el.classList.contains("mat-radio-checked");
+}"""
+
 
 class BancoChileScraper(BaseScraper):
     """
@@ -21,43 +51,331 @@ class BancoChileScraper(BaseScraper):
     FORM_TIMEOUT = 15000  # 15 seconds for form elements
     PAGE_LOAD_TIMEOUT = 30000  # 30 seconds for page loads
 
+    # Selector fallbacks, tried in priority order. Kept at class level so the
+    # lists are built once rather than on every call.
+    LOGIN_BUTTON_SELECTORS = (
+        'a:has-text("Banco en Línea")',
+        'a:has-text("Ingresar")',
+        'button:has-text("Ingresar")',
+        'a[href*="login"]',
+        'button[data-test*="login"]',
+        'a:has-text("Acceder")',
+        ".login-button",
+        '[data-cy="login"]',
+        'a.btn:has-text("Banco")',
+        'button.btn:has-text("Banco")',
+    )
+    LOGIN_FALLBACK_URLS = (
+        "https://login.portales.bancochile.cl/login",
+        "https://portalpersonas.bancochile.cl/login",
+        "https://sitiospublicos.bancochile.cl/personas/login",
+    )
+    LOGIN_PAGE_SELECTORS = (
+        'input[name="username"]',
+        'input[name="rut"]',
+        'input[aria-label="RUT"]',
+        'input[placeholder*="RUT"]',
+        'role=textbox[name="RUT"]',
+    )
+    ERROR_PAGE_SELECTORS = (
+        ':has-text("mantenimiento")',
+        ':has-text("maintenance")',
+        ':has-text("error")',
+        ':has-text("bloqueado")',
+        ".error-page",
+        ".maintenance-page",
+    )
+    # The login form is detected by its username field, which is then filled
+    # directly instead of being looked up a second time.
+    USERNAME_SELECTORS = (
+        'input[placeholder*="RUT"]',
+        'input[autocomplete="username"]',
+        'input[aria-label="RUT"]',
+        'input[name="username"]',
+        'input[name="rut"]',
+        "#username",
+        "#rut",
+        'input[type="text"]:visible',
+        'input[placeholder*="rut"]',
+        'input[name="user"]',
+        "#user",
+        'input[data-testid="username"]',
+        ".username-input",
+        ".rut-input",
+        'role=textbox[name="RUT"]',
+    )
+    PASSWORD_SELECTORS = (
+        'input[type="password"]:visible',
+        'input[autocomplete="current-password"]',
+        'input[name="password"]',
+        'input[aria-label*="Contraseña"]',
+        'input[placeholder*="contraseña"]',
+        'input[placeholder*="Contraseña"]',
+        "#password",
+    )
+    SUBMIT_SELECTORS = (
+        'button[aria-label="Ingresar a cuenta"]',
+        'button:has-text("Ingresar a cuenta")',
+        'button[type="submit"]:visible',
+        'input[type="submit"]:visible',
+        'button:has-text("Ingresar")',
+        'button:has-text("Entrar")',
+        'button:has-text("Acceder")',
+        "button.btn-primary",
+        "button.login-button",
+        ".login-submit",
+        '[data-cy="submit"]',
+        'role=button[name="Ingresar a cuenta"]',
+    )
+    LOGIN_SUCCESS_SELECTORS = (
+        'button:has-text("Mis Productos")',
+        'a:has-text("Mis Productos")',
+        'nav:has-text("Productos")',
+        ".main-menu",
+        ".dashboard",
+        'h1:has-text("Bienvenido")',
+        '[data-testid="dashboard"]',
+    )
+    LOGIN_ERROR_SELECTORS = (
+        ':has-text("usuario o contraseña")',
+        ':has-text("credenciales")',
+        ':has-text("error")',
+        ".error-message",
+        ".alert-danger",
+    )
+    OVERLAY_SELECTORS = (
+        ".cdk-overlay-backdrop",
+        ".fondo",
+        ".overlay",
+        ".modal-backdrop",
+        '[class*="backdrop"]',
+    )
+    POPUP_CLOSE_SELECTORS = (
+        # The close button is located through its icon, then the button
+        # around it, which avoids a :has() scan of every button on the page.
+        "button.btn.default.pull-right:not([hidden]) i.ion-ios-close-empty >> xpath=ancestor::button[1]",
+        "button.close",
+        "button:has-text('×')",
+        "[aria-label='Close']",
+        ".modal-close",
+        ".popup-close",
+        "button[data-dismiss='modal']",
+    )
+    TABLE_OR_MESSAGE_SELECTORS = (
+        "table.bch-table",
+        "div.bch-alert:has-text('No existe información')",
+        "div.alert:has-text('No existe')",
+        ".no-data-message",
+        "table:has(tbody tr)",
+        ".movements-table",
+    )
+    NO_DATA_SELECTORS = (
+        "div.bch-alert:has-text('No existe información')",
+        "div.alert:has-text('No existe')",
+        "div:has-text('No hay movimientos')",
+        "div:has-text('Sin movimientos')",
+        ".no-data",
+        ".empty-state",
+    )
+    ROW_SELECTORS = (
+        "table.bch-table tbody tr.bch-row",
+        "table tbody tr:not(.no-data)",
+        "tbody tr.movement-row",
+        "table tr[data-row]",
+        "tbody tr:has(td)",
+    )
+    PAGINATOR_LABEL_SELECTOR = "div.mat-paginator-range-actions .mat-paginator-label"
+    NEXT_PAGE_SELECTORS = (
+        'button[aria-label="Próxima página"]',
+        'button[aria-label="Next page"]',
+        'button:has-text("Siguiente")',
+        ".mat-paginator-navigation-next",
+        "button.mat-paginator-navigation-next",
+        'button[data-cy="next-page"]',
+    )
+    PRODUCTS_MENU_SELECTORS = (
+        'button:has-text("Mis Productos")',
+        'a:has-text("Mis Productos")',
+        ".main-menu-products",
+    )
+    MOVEMENTS_LINK_SELECTORS = (
+        'a[href="#/movimientos/cuenta/saldos-movimientos"]',
+        'a:has-text("Saldos y Movimientos")',
+        'a:has-text("Movimientos")',
+        ".movements-link",
+    )
+    ACCOUNT_MODAL_SELECTORS = (
+        'h2:has-text("Seleccione una cuenta")',
+        'h1:has-text("Seleccione una cuenta")',
+        '.modal-title:has-text("Seleccione")',
+        'mat-select[name="monedas"]',
+    )
+    CURRENCY_DROPDOWN_SELECTORS = (
+        'mat-select[name="monedas"]',
+        ".currency-selector",
+        'select[name="currency"]',
+    )
+    CURRENCY_OPTION_SELECTORS = (
+        "mat-option span.mat-option-text",
+        "mat-option",
+        "option",
+        ".currency-option",
+    )
+    ACCOUNT_RADIO_SELECTORS = (
+        "mat-radio-button",
+        ".radio-button",
+        "input[type='radio']",
+    )
+    ACCEPT_SELECTORS = (
+        'bch-button[id="modalPrimaryBtn"] button:has-text("Aceptar")',
+        'button:has-text("Aceptar")',
+        'button:has-text("Confirmar")',
+        'button[type="submit"]',
+        ".modal-confirm",
+        "#modalPrimaryBtn",
+    )
+    SELECT_OTHER_ACCOUNT_SELECTORS = (
+        'button:has-text("Seleccionar otra cuenta")',
+        'a:has-text("SELECCIONAR OTRA CUENTA")',
+        'a:has-text("Seleccionar otra cuenta")',
+        'button:has-text("SELECCIONAR OTRA CUENTA")',
+        'button:has-text("Cambiar cuenta")',
+        'a:has-text("Cambiar cuenta")',
+        '[data-test*="select-account"]',
+        'a[href*="seleccionar"]',
+        ".account-selector-link",
+        "button.change-account",
+    )
+    ACCOUNT_MODAL_RETURN_SELECTORS = (
+        'h2:has-text("Seleccione una cuenta")',
+        'h1:has-text("Seleccione una cuenta")',
+        '.modal-title:has-text("Seleccione")',
+        'mat-select[name="monedas"]',
+        ".account-selector",
+        ".currency-selector",
+    )
+    CREDIT_CARD_MENU_SELECTORS = (
+        'button[id="41300"]:has-text("Tarjeta de Crédito")',
+        'button:has-text("Tarjeta de Crédito")',
+        'a:has-text("Tarjeta de Crédito")',
+        ".credit-card-menu",
+    )
+    CARD_TABLE_SELECTORS = (
+        "table.bch-table",
+        "table:has(tbody tr)",
+        ".movements-table",
+    )
+
+    # Cell selectors of each movement table column, relative to the row, with
+    # fallbacks in priority order. Read in one round-trip by `_extract_table`.
+    ACCOUNT_COLUMNS = {
+        "date": (
+            "td.cdk-column-fechaContable",
+            "td:nth-child(1)",
+            ".date-column",
+            "td[data-column='date']",
+        ),
+        "description": (
+            "td.cdk-column-descripcion",
+            "td:nth-child(2)",
+            ".description-column",
+            "td[data-column='description']",
+        ),
+        "cargo": (
+            "td.cdk-column-cargo",
+            "td:nth-child(3)",
+            ".debit-column",
+            "td[data-column='debit']",
+        ),
+        "abono": (
+            "td.cdk-column-abono",
+            "td:nth-child(4)",
+            ".credit-column",
+            "td[data-column='credit']",
+        ),
+    }
+    CARD_COLUMNS = {
+        "date": ("td.cdk-column-fechaTransaccion", "td:nth-child(1)"),
+        "tipo": ("td.cdk-column-tipoMovimientoLabel", "td:nth-child(2)"),
+        "description": ("td.cdk-column-descripcion", "td:nth-child(3)"),
+        "cuotas": ("td.cdk-column-cuotas", "td:nth-child(4)"),
+        "cargo": ("td.cdk-column-cargo", "td:nth-child(5)"),
+        "pago": ("td.cdk-column-pago", "td:nth-child(6)"),
+    }
+
     def _get_bank_id(self) -> str:
         return "cl_banco_chile"
 
     def _find_element_with_fallbacks(
-        self, selectors: List[str], timeout: int = 5000, visible: bool = True
+        self, selectors: Sequence[str], timeout: int = 5000, visible: bool = True
     ) -> Optional[Locator]:
-        """Try multiple selectors and return the first one that works."""
+        """
+        Waits for any of the selectors to match and returns the first match of
+        the earliest selector in the list that has one.
+
+        All selectors are waited on at once through a single union locator, so
+        ``timeout`` bounds the whole search instead of each selector in turn.
+        A timeout of 0 checks the page once without waiting.
+        """
         page = self._ensure_page()
 
-        # Split timeout across all selectors
-        selector_timeout = (
-            max(1000, timeout // len(selectors)) if len(selectors) > 1 else timeout
-        )
+        candidates = [page.locator(selector) for selector in selectors]
+        if visible:
+            candidates = [c.locator("visible=true") for c in candidates]
+        any_candidate = functools.reduce(Locator.or_, candidates)
+
+        try:
+            if timeout > 0:
+                any_candidate.first.wait_for(state="attached", timeout=timeout)
+            elif any_candidate.count() == 0:
+                return None
+        except PlaywrightTimeoutError:
+            logger.debug(f"No element found with any of {len(selectors)} selectors")
+            return None
+        except Exception as e:
+            # e.g. one invalid selector breaks the union; try them one by one.
+            logger.debug(f"Combined selector search failed: {e}")
 
-        for i, selector in enumerate(selectors):
+        for i, candidate in enumerate(candidates):
             try:
-                element = page.locator(selector)
-                if visible:
-                    if element.is_visible(timeout=selector_timeout):
-                        logger.debug(
-                            f"Found element with selector '{selector}' (attempt {i + 1})"
-                        )
-                        return element
-                else:
-                    if element.count() > 0:
-                        logger.debug(
-                            f"Found element with selector '{selector}' (attempt {i + 1})"
-                        )
-                        return element
+                if candidate.count() > 0:
+                    logger.debug(
+                        f"Found element with selector '{selectors[i]}' (attempt {i + 1})"
+                    )
+                    return candidate.first
             except Exception as e:
-                logger.debug(f"Selector '{selector}' failed: {e}")
-                continue
+                logger.debug(f"Selector '{selectors[i]}' failed: {e}")
 
         logger.debug(f"No element found with any of {len(selectors)} selectors")
         return None
 
-    def _click_with_fallbacks(self, selectors: List[str], timeout: int = 5000) -> bool:
+    def _wait_until_visible(self, selector: str, timeout: int = 8000) -> None:
+        """
+        Waits for the first match of a selector to be visible. On timeout it
+        only logs, leaving the caller's own checks to handle the missing element.
+        """
+        try:
+            self._ensure_page().locator(selector).first.wait_for(
+                state="visible", timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            logger.warning(f"Timed out waiting for '{selector}' to be visible.")
+
+    def _wait_for_account_radios(self, timeout: int = 8000) -> None:
+        """
+        Waits for the account radios of the selected currency to be rendered.
+        On timeout it only logs, like `_wait_until_visible`.
+        """
+        try:
+            self._ensure_page().wait_for_function(
+                _ACCOUNTS_READY_SCRIPT, timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            logger.warning("Timed out waiting for the account list to load.")
+
+    def _click_with_fallbacks(
+        self, selectors: Sequence[str], timeout: int = 5000
+    ) -> bool:
         """Try to click using multiple selectors."""
         element = self._find_element_with_fallbacks(selectors, timeout)
         if element:
@@ -85,7 +403,7 @@ class BancoChileScraper(BaseScraper):
         return False
 
     def _type_with_fallbacks(
-        self, selectors: List[str], text: str, timeout: int = 5000
+        self, selectors: Sequence[str], text: str, timeout: int = 5000
     ) -> bool:
         """Try to type text using multiple selectors."""
         element = self._find_element_with_fallbacks(selectors, timeout)
@@ -109,20 +427,10 @@ class BancoChileScraper(BaseScraper):
 
         # Look for login button - try multiple possible selectors
         logger.info("Looking for login access button.")
-        login_selectors = [
-            'a:has-text("Banco en Línea")',
-            'a:has-text("Ingresar")',
-            'button:has-text("Ingresar")',
-            'a[href*="login"]',
-            'button[data-test*="login"]',
-            'a:has-text("Acceder")',
-            ".login-button",
-            '[data-cy="login"]',
-            'a.btn:has-text("Banco")',
-            'button.btn:has-text("Banco")',
-        ]
 
-        login_clicked = self._click_with_fallbacks(login_selectors, timeout=5000)
+        login_clicked = self._click_with_fallbacks(
+            self.LOGIN_BUTTON_SELECTORS, timeout=5000
+        )
         if login_clicked:
             logger.info("Successfully clicked login button")
             # Wait for page navigation after clicking login button
@@ -139,14 +447,9 @@ class BancoChileScraper(BaseScraper):
             logger.info(
                 "No login button found, trying direct navigation to login page."
             )
-            login_urls = [
-                "https://login.portales.bancochile.cl/login",
-                "https://portalpersonas.bancochile.cl/login",
-                "https://sitiospublicos.bancochile.cl/personas/login",
-            ]
 
             login_form_found = False
-            for login_url in login_urls:
+            for login_url in self.LOGIN_FALLBACK_URLS:
                 try:
                     logger.info(f"Trying to navigate to: {login_url}")
                     self._navigate(login_url)
@@ -155,13 +458,9 @@ class BancoChileScraper(BaseScraper):
                     page.wait_for_timeout(2000)
 
                     # Check if we found a login form
-                    form_selectors = [
-                        'input[name="username"]',
-                        'input[name="rut"]',
-                        'role=textbox[name="RUT"]',
-                        'input[placeholder*="RUT"]',
-                    ]
-                    if self._find_element_with_fallbacks(form_selectors, timeout=8000):
+                    if self._find_element_with_fallbacks(
+                        self.LOGIN_PAGE_SELECTORS, timeout=8000
+                    ):
                         logger.info(
                             f"Successfully navigated to login page: {login_url}"
                         )
@@ -175,23 +474,6 @@ class BancoChileScraper(BaseScraper):
                 logger.warning("Could not find login form through direct navigation")
 
         # Wait for login form elements with extended timeout and multiple attempts
-        form_selectors = [
-            'input[placeholder*="RUT"]',
-            'input[placeholder*="rut"]',
-            'role=textbox[name="RUT"]',
-            'input[name="username"]',
-            'input[name="rut"]',
-            'input[name="user"]',
-            "#username",
-            "#rut",
-            "#user",
-            'input[type="text"]:visible',
-            'input[autocomplete="username"]',
-            'input[data-testid="username"]',
-            ".username-input",
-            ".rut-input",
-        ]
-
         # Try multiple times with increasing timeouts
         form_element = None
         for attempt in range(3):
@@ -203,7 +485,7 @@ class BancoChileScraper(BaseScraper):
             )
 
             form_element = self._find_element_with_fallbacks(
-                form_selectors, timeout=timeout
+                self.USERNAME_SELECTORS, timeout=timeout
             )
             if form_element:
                 break
@@ -224,17 +506,8 @@ class BancoChileScraper(BaseScraper):
             logger.error(f"Current URL: {current_url}")
 
             # Check for common error indicators
-            error_indicators = [
-                ':has-text("mantenimiento")',
-                ':has-text("maintenance")',
-                ':has-text("error")',
-                ':has-text("bloqueado")',
-                ".error-page",
-                ".maintenance-page",
-            ]
-
             error_found = self._find_element_with_fallbacks(
-                error_indicators, timeout=3000
+                self.ERROR_PAGE_SELECTORS, timeout=3000
             )
             if error_found:
                 error_text = error_found.inner_text()[:200]
@@ -250,22 +523,11 @@ class BancoChileScraper(BaseScraper):
 
         logger.info("Entering credentials.")
 
-        # Find and fill username/RUT field with improved selectors order
-        username_selectors = [
-            'input[placeholder*="RUT"]',
-            'input[autocomplete="username"]',
-            'role=textbox[name="RUT"]',
-            'input[name="username"]',
-            'input[name="rut"]',
-            "#username",
-            "#rut",
-            'input[type="text"]:visible:first',
-        ]
-
-        username_filled = self._type_with_fallbacks(
-            username_selectors, self.user, timeout=5000
-        )
-        if not username_filled:
+        # The form element found above is the username/RUT field itself
+        try:
+            form_element.fill(self.user)
+        except Exception as e:
+            logger.warning(f"Failed to type in element: {e}")
             self._save_debug_info("username_field_not_found")
             raise LoginError(
                 "Could not find or fill username/RUT field with improved selectors"
@@ -274,18 +536,8 @@ class BancoChileScraper(BaseScraper):
         logger.info("Successfully filled username field")
 
         # Find and fill password field with improved selectors
-        password_selectors = [
-            'input[type="password"]:visible',
-            'input[autocomplete="current-password"]',
-            'input[name="password"]',
-            'role=textbox[name="Contraseña"]',
-            'input[placeholder*="contraseña"]',
-            'input[placeholder*="Contraseña"]',
-            "#password",
-        ]
-
         password_filled = self._type_with_fallbacks(
-            password_selectors, self.password, timeout=5000
+            self.PASSWORD_SELECTORS, self.password, timeout=5000
         )
         if not password_filled:
             self._save_debug_info("password_field_not_found")
@@ -300,20 +552,7 @@ class BancoChileScraper(BaseScraper):
         logger.info("Submitting login form.")
 
         # Find and click submit button with improved selectors
-        submit_selectors = [
-            'role=button[name="Ingresar a cuenta"]',
-            'button[type="submit"]:visible',
-            'input[type="submit"]:visible',
-            'button:has-text("Ingresar")',
-            'button:has-text("Entrar")',
-            'button:has-text("Acceder")',
-            "button.btn-primary",
-            "button.login-button",
-            ".login-submit",
-            '[data-cy="submit"]',
-        ]
-
-        submit_clicked = self._click_with_fallbacks(submit_selectors, timeout=5000)
+        submit_clicked = self._click_with_fallbacks(self.SUBMIT_SELECTORS, timeout=5000)
 
         if not submit_clicked:
             # Try pressing Enter as fallback
@@ -328,42 +567,21 @@ class BancoChileScraper(BaseScraper):
         logger.info("Waiting for post-login page.")
 
         # Multiple indicators of successful login
-        success_selectors = [
-            'button:has-text("Mis Productos")',
-            'a:has-text("Mis Productos")',
-            'nav:has-text("Productos")',
-            ".main-menu",
-            ".dashboard",
-            'h1:has-text("Bienvenido")',
-            '[data-testid="dashboard"]',
-        ]
-
-        login_successful = False
         try:
-            for selector in success_selectors:
-                try:
-                    page.wait_for_selector(selector, timeout=8000)
-                    logger.info(f"Login success detected with selector: {selector}")
-                    login_successful = True
-                    break
-                except PlaywrightTimeoutError:
-                    continue
+            login_successful = (
+                self._find_element_with_fallbacks(
+                    self.LOGIN_SUCCESS_SELECTORS, timeout=self.LOGIN_TIMEOUT
+                )
+                is not None
+            )
 
             if login_successful:
                 self._save_debug_info("03_login_success")
                 logger.info("Login to Banco de Chile successful.")
             else:
                 # Additional checks for error messages
-                error_selectors = [
-                    ':has-text("usuario o contraseña")',
-                    ':has-text("credenciales")',
-                    ':has-text("error")',
-                    ".error-message",
-                    ".alert-danger",
-                ]
-
                 error_found = self._find_element_with_fallbacks(
-                    error_selectors, timeout=3000
+                    self.LOGIN_ERROR_SELECTORS, timeout=3000
                 )
                 if error_found:
                     error_text = error_found.inner_text()[:100]  # First 100 chars
@@ -387,15 +605,7 @@ class BancoChileScraper(BaseScraper):
 
         try:
             # Look for common overlay elements
-            overlay_selectors = [
-                ".cdk-overlay-backdrop",
-                ".fondo",
-                ".overlay",
-                ".modal-backdrop",
-                '[class*="backdrop"]',
-            ]
-
-            for selector in overlay_selectors:
+            for selector in self.OVERLAY_SELECTORS:
                 try:
                     overlays = page.locator(selector)
                     if overlays.count() > 0:
@@ -423,19 +633,11 @@ class BancoChileScraper(BaseScraper):
         page = self._ensure_page()
         logger.info("Checking for marketing popup.")
 
-        popup_close_selectors = [
-            "button.btn.default.pull-right:has(i.ion-ios-close-empty):not([hidden])",
-            "button.close",
-            "button:has-text('×')",
-            "[aria-label='Close']",
-            ".modal-close",
-            ".popup-close",
-            "button[data-dismiss='modal']",
-        ]
-
         try:
+            # Called once the dashboard has settled: only close a popup that is
+            # already shown instead of waiting for one that may never appear.
             popup_closed = self._click_with_fallbacks(
-                popup_close_selectors, timeout=10000
+                self.POPUP_CLOSE_SELECTORS, timeout=0
             )
             if popup_closed:
                 logger.info("Marketing popup closed successfully.")
@@ -455,26 +657,11 @@ class BancoChileScraper(BaseScraper):
         movements: List[MovementModel] = []
 
         # Wait for either the table or a "no info" message with improved selectors
-        table_or_message_selectors = [
-            "table.bch-table",
-            "div.bch-alert:has-text('No existe información')",
-            "div.alert:has-text('No existe')",
-            ".no-data-message",
-            "table:has(tbody tr)",
-            ".movements-table",
-        ]
-
         try:
             # Try to find either table or no-data message
-            element_found = False
-            for selector in table_or_message_selectors:
-                try:
-                    page.wait_for_selector(selector, timeout=8000)
-                    element_found = True
-                    logger.info(f"Found element with selector: {selector}")
-                    break
-                except PlaywrightTimeoutError:
-                    continue
+            element_found = self._find_element_with_fallbacks(
+                self.TABLE_OR_MESSAGE_SELECTORS, timeout=self.PAGE_LOAD_TIMEOUT
+            )
 
             if not element_found:
                 logger.warning(
@@ -489,17 +676,9 @@ class BancoChileScraper(BaseScraper):
             return []
 
         # Check for "no data" messages with multiple possible selectors
-        no_data_selectors = [
-            "div.bch-alert:has-text('No existe información')",
-            "div.alert:has-text('No existe')",
-            "div:has-text('No hay movimientos')",
-            "div:has-text('Sin movimientos')",
-            ".no-data",
-            ".empty-state",
-        ]
-
+        # The table or message is already on the page, so check without waiting.
         no_data_element = self._find_element_with_fallbacks(
-            no_data_selectors, timeout=3000
+            self.NO_DATA_SELECTORS, timeout=0
         )
         if no_data_element:
             logger.info(f"No movements found for account {account_id} in {currency}.")
@@ -508,131 +687,78 @@ class BancoChileScraper(BaseScraper):
         logger.info(f"Extracting movements for account {account_id} in {currency}.")
         self._save_debug_info(f"movements_table_{currency}_{account_id}")
 
+        # The table layout is the same on every page: build these once and pick
+        # the row selector on the first page only.
+        paginator_label = page.locator(self.PAGINATOR_LABEL_SELECTOR)
+        row_selector: Optional[str] = None
+        # Set once the paginator wait has also seen the next page's rows.
+        rows_ready = False
+
         page_num = 1
         while True:
             logger.info(f"Scraping page {page_num} for account {account_id}.")
 
-            # Check for table rows with improved selectors
-            row_selectors = [
-                "table.bch-table tbody tr.bch-row",
-                "table tbody tr:not(.no-data)",
-                "tbody tr.movement-row",
-                "table tr[data-row]",
-                "tbody tr:has(td)",
-            ]
-
-            rows_found = False
-            for selector in row_selectors:
-                try:
-                    page.wait_for_selector(selector, timeout=5000)
-                    rows_found = True
+            # Check for table rows with improved selectors. A "no data" alert
+            # that shows up after the empty table also ends the wait.
+            if not rows_ready:
+                self._find_element_with_fallbacks(
+                    self.ROW_SELECTORS + self.NO_DATA_SELECTORS, timeout=5000
+                )
+                if not self._find_element_with_fallbacks(self.ROW_SELECTORS, timeout=0):
+                    logger.info("Movement table is present, but contains no rows.")
                     break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not rows_found:
-                logger.info("Movement table is present, but contains no rows.")
-                break
 
             # Get table rows with improved selectors to exclude detail/collapsed rows
-            row_selector = "table.bch-table tbody tr.bch-row:not(.table-collapse-row)"
-            if not page.locator(row_selector).count():
-                # Fallback selector if the specific class names don't work
-                row_selector = "table tbody tr:has(td):not(:has(.collapse))"
+            if row_selector is None:
+                row_selector = (
+                    "table.bch-table tbody tr.bch-row:not(.table-collapse-row)"
+                )
+                if not page.locator(row_selector).count():
+                    # Fallback selector if the specific class names don't work
+                    row_selector = "table tbody tr:has(td):not(:has(.collapse))"
 
-            rows = page.locator(row_selector).all()
-            logger.info(f"Found {len(rows)} rows to process on page {page_num}")
+            rows = self._extract_table(row_selector, self.ACCOUNT_COLUMNS)
 
-            for i, row in enumerate(rows):
+            # Rows are already read, so request the next page before parsing
+            # them: the browser loads it while Python builds the movements.
+            next_button = self._find_element_with_fallbacks(
+                self.NEXT_PAGE_SELECTORS, timeout=3000
+            )
+            has_next_page = False
+            paginator_text_before = ""
+            if next_button is not None and not next_button.is_disabled():
+                has_next_page = True
                 try:
-                    # Try multiple selectors for each column in case structure changes
-                    date_selectors = [
-                        "td.cdk-column-fechaContable",
-                        "td:nth-child(1)",
-                        ".date-column",
-                        "td[data-column='date']",
-                    ]
-                    desc_selectors = [
-                        "td.cdk-column-descripcion",
-                        "td:nth-child(2)",
-                        ".description-column",
-                        "td[data-column='description']",
-                    ]
-                    cargo_selectors = [
-                        "td.cdk-column-cargo",
-                        "td:nth-child(3)",
-                        ".debit-column",
-                        "td[data-column='debit']",
-                    ]
-                    abono_selectors = [
-                        "td.cdk-column-abono",
-                        "td:nth-child(4)",
-                        ".credit-column",
-                        "td[data-column='credit']",
-                    ]
-
-                    # Find elements within this specific row using multiple selectors
-                    date_element = None
-                    desc_element = None
-                    cargo_element = None
-                    abono_element = None
-
-                    # Try each selector for date
-                    for sel in date_selectors:
-                        try:
-                            candidate = row.locator(sel)
-                            if candidate.count() > 0:
-                                date_element = candidate
-                                break
-                        except Exception:
-                            continue
-
-                    # Try each selector for description
-                    for sel in desc_selectors:
-                        try:
-                            candidate = row.locator(sel)
-                            if candidate.count() > 0:
-                                desc_element = candidate
-                                break
-                        except Exception:
-                            continue
+                    # A short timeout because if it's not there, we shouldn't wait long.
+                    paginator_text_before = paginator_label.inner_text(timeout=3000)
+                except PlaywrightTimeoutError:
+                    logger.warning(
+                        "Paginator label not found before clicking next. Waiting may be unreliable."
+                    )
 
-                    # Try each selector for cargo
-                    for sel in cargo_selectors:
-                        try:
-                            candidate = row.locator(sel)
-                            if candidate.count() > 0:
-                                cargo_element = candidate
-                                break
-                        except Exception:
-                            continue
+                logger.info(
+                    f"Going to next page of movements for account {account_id}."
+                )
+                self._click(next_button)
+            else:
+                logger.info(f"Last page of movements reached for account {account_id}.")
 
-                    # Try each selector for abono
-                    for sel in abono_selectors:
-                        try:
-                            candidate = row.locator(sel)
-                            if candidate.count() > 0:
-                                abono_element = candidate
-                                break
-                        except Exception:
-                            continue
+            logger.info(f"Found {len(rows)} rows to process on page {page_num}")
 
-                    if not all([date_element, desc_element]):
+            for i, row in enumerate(rows):
+                try:
+                    if row["date"] is None or row["description"] is None:
                         logger.warning(
                             f"Could not find required elements in row {i + 1}"
                         )
                         continue
 
-                    date_str = date_element.inner_text().strip() if date_element else ""
-                    description = (
-                        desc_element.inner_text().strip() if desc_element else ""
-                    )
-                    cargo_str = (
-                        cargo_element.inner_text().strip() if cargo_element else ""
-                    )
-                    abono_str = (
-                        abono_element.inner_text().strip() if abono_element else ""
-                    )
+                    # Dates repeat across many rows and are kept in raw_data,
+                    # so share one string object per distinct date.
+                    date_str = sys.intern(row["date"])
+                    description = row["description"]
+                    cargo_str = row["cargo"] or ""
+                    abono_str = row["abono"] or ""
 
                     # Validate and parse date
                     if not date_str:
@@ -673,7 +799,7 @@ class BancoChileScraper(BaseScraper):
                         continue
 
                     # Create movement with enhanced data
-                    movement = MovementModel(
+                    movement = MovementModel.build(
                         date=date,
                         description=description,
                         amount=amount,
@@ -706,47 +832,27 @@ class BancoChileScraper(BaseScraper):
                     except Exception:
                         pass  # Don't let debug saving break the flow
 
-            # Check for next page button with multiple selectors
-            next_page_selectors = [
-                'button[aria-label="Próxima página"]',
-                'button[aria-label="Next page"]',
-                'button:has-text("Siguiente")',
-                ".mat-paginator-navigation-next",
-                "button.mat-paginator-navigation-next",
-                'button[data-cy="next-page"]',
-            ]
-
-            next_button = self._find_element_with_fallbacks(
-                next_page_selectors, timeout=3000
-            )
-
-            if not next_button or next_button.is_disabled():
-                logger.info(f"Last page of movements reached for account {account_id}.")
+            if not has_next_page:
                 break
-
-            paginator_label = page.locator(
-                "div.mat-paginator-range-actions .mat-paginator-label"
-            )
-            paginator_text_before = ""
-            try:
-                # A short timeout because if it's not there, we shouldn't wait long.
-                paginator_text_before = paginator_label.inner_text(timeout=3000)
-            except PlaywrightTimeoutError:
-                logger.warning(
-                    "Paginator label not found before clicking next. Waiting may be unreliable."
-                )
-
-            logger.info(f"Going to next page of movements for account {account_id}.")
             page_num += 1
-            self._click(next_button)
 
             # Wait for the paginator text to change, which is a reliable signal that the
             # new page's data has loaded. This avoids flaky 'networkidle' waits.
+            rows_ready = False
             if paginator_text_before:
                 try:
-                    expect(paginator_label).not_to_have_text(
-                        paginator_text_before, timeout=20000
+                    # Polled inside the page rather than from Python, together
+                    # with the rows, so the next page needs no separate row wait.
+                    page.wait_for_function(
+                        _NEXT_PAGE_READY_SCRIPT,
+                        arg=[
+                            self.PAGINATOR_LABEL_SELECTOR,
+                            paginator_text_before,
+                            row_selector,
+                        ],
+                        timeout=20000,
                     )
+                    rows_ready = True
                 except PlaywrightTimeoutError:
                     logger.warning(
                         "Paginator text did not change after clicking next. "
@@ -828,12 +934,9 @@ class BancoChileScraper(BaseScraper):
         logger.info("Navigating to 'Saldos y Movimientos' section.")
 
         # Navigate to movements section with improved selectors
-        products_selectors = [
-            'button:has-text("Mis Productos")',
-            'a:has-text("Mis Productos")',
-            ".main-menu-products",
-        ]
-        products_clicked = self._click_with_fallbacks(products_selectors, timeout=10000)
+        products_clicked = self._click_with_fallbacks(
+            self.PRODUCTS_MENU_SELECTORS, timeout=10000
+        )
 
         if not products_clicked:
             raise DataExtractionError("Could not find 'Mis Productos' menu")
@@ -847,14 +950,8 @@ class BancoChileScraper(BaseScraper):
         navigation_successful = False
 
         # Approach 1: Regular click with better selectors
-        movements_selectors = [
-            'a[href="#/movimientos/cuenta/saldos-movimientos"]',
-            'a:has-text("Saldos y Movimientos")',
-            'a:has-text("Movimientos")',
-            ".movements-link",
-        ]
         movements_clicked = self._click_with_fallbacks(
-            movements_selectors, timeout=8000
+            self.MOVEMENTS_LINK_SELECTORS, timeout=8000
         )
 
         if movements_clicked:
@@ -909,24 +1006,9 @@ class BancoChileScraper(BaseScraper):
             return []
 
         # Wait for account selection modal with improved selectors
-        modal_selectors = [
-            'h2:has-text("Seleccione una cuenta")',
-            'h1:has-text("Seleccione una cuenta")',
-            '.modal-title:has-text("Seleccione")',
-            'mat-select[name="monedas"]',
-        ]
-
-        modal_found = False
-        for selector in modal_selectors:
-            try:
-                page.wait_for_selector(selector, timeout=10000)
-                modal_found = True
-                logger.info(
-                    f"Account selection modal opened (detected with: {selector})"
-                )
-                break
-            except PlaywrightTimeoutError:
-                continue
+        modal_found = self._find_element_with_fallbacks(
+            self.ACCOUNT_MODAL_SELECTORS, timeout=self.FORM_TIMEOUT
+        )
 
         if not modal_found:
             self._save_debug_info("account_selection_modal_not_found")
@@ -938,46 +1020,32 @@ class BancoChileScraper(BaseScraper):
         self._save_debug_info("06_account_selection_modal_opened")
 
         # Get all currency options with improved error handling
-        currency_selectors = [
-            'mat-select[name="monedas"]',
-            ".currency-selector",
-            'select[name="currency"]',
-        ]
         currency_dropdown_clicked = self._click_with_fallbacks(
-            currency_selectors, timeout=10000
+            self.CURRENCY_DROPDOWN_SELECTORS, timeout=10000
         )
 
         if not currency_dropdown_clicked:
             raise DataExtractionError("Could not find or click currency dropdown")
 
-        page.wait_for_timeout(1000)  # Wait for options to load
+        self._wait_until_visible("mat-option")
 
         # Try multiple selectors for currency options
-        option_selectors = [
-            "mat-option span.mat-option-text",
-            "mat-option",
-            "option",
-            ".currency-option",
-        ]
-
         currency_options_loc = None
-        for selector in option_selectors:
+        for selector in self.CURRENCY_OPTION_SELECTORS:
             options = page.locator(selector)
             if options.count() > 0:
                 currency_options_loc = options
                 break
 
-        if not currency_options_loc or currency_options_loc.count() == 0:
+        if currency_options_loc is None:
             raise DataExtractionError("No currency options found in dropdown")
 
-        currency_texts = []
-        for i in range(currency_options_loc.count()):
-            try:
-                text = currency_options_loc.nth(i).inner_text().strip()
-                if text:  # Only add non-empty options
-                    currency_texts.append(text)
-            except Exception as e:
-                logger.warning(f"Could not get text for currency option {i}: {e}")
+        # Read every option label in one round-trip, skipping empty options.
+        currency_texts = [
+            text
+            for text in map(str.strip, currency_options_loc.all_inner_texts())
+            if text
+        ]
 
         # Close dropdown
         try:
@@ -994,15 +1062,23 @@ class BancoChileScraper(BaseScraper):
 
         logger.info(f"Found currencies: {currency_texts}")
 
+        # Once the "select another account" button is found missing, later
+        # accounts go straight to the navigation workaround instead of waiting
+        # for it again.
+        select_other_account_missing = False
+        # Account radios sometimes need a double click to register. Switch to it
+        # for the remaining accounts once a single click did not select one.
+        double_click_radio = False
+
         for i_currency, currency_text in enumerate(currency_texts):
             logger.info(f"Processing currency: {currency_text}")
 
             # Select currency in modal. The modal should already be open.
             self._click('mat-select[name="monedas"]')
             self._click(f'mat-option:has-text("{currency_text}")')
-            page.wait_for_timeout(2000)  # Give time for accounts to load
+            self._wait_for_account_radios()
 
-            currency_code_match = re.search(r"\((.*?)\)", currency_text)
+            currency_code_match = _CURRENCY_CODE.search(currency_text)
             if not currency_code_match:
                 logger.warning(
                     f"Could not extract currency code from '{currency_text}', skipping."
@@ -1011,10 +1087,10 @@ class BancoChileScraper(BaseScraper):
             currency_code = currency_code_match.group(1).strip()
 
             account_labels = [
-                loc.inner_text().strip()
-                for loc in page.locator(
+                text.strip()
+                for text in page.locator(
                     "mat-radio-button .mat-radio-label-content"
-                ).all()
+                ).all_inner_texts()
             ]
             logger.info(
                 f"Found {len(account_labels)} accounts for {currency_code}: {account_labels}"
@@ -1026,14 +1102,9 @@ class BancoChileScraper(BaseScraper):
                 )
 
                 # Use nth to select the correct radio button to avoid ambiguity
-                radio_selectors = [
-                    "mat-radio-button",
-                    ".radio-button",
-                    "input[type='radio']",
-                ]
                 account_radio = None
 
-                for selector in radio_selectors:
+                for selector in self.ACCOUNT_RADIO_SELECTORS:
                     radios = page.locator(selector)
                     if radios.count() > i_account:
                         account_radio = radios.nth(i_account)
@@ -1044,15 +1115,9 @@ class BancoChileScraper(BaseScraper):
                     continue
 
                 # Extract account ID with improved regex
-                account_id_patterns = [
-                    r"([\d-]+)",  # Original pattern
-                    r"(\d{2}-\d{3}-\d{5}-\d{2})",  # Specific Chilean account format
-                    r"(\d+)",  # Just numbers
-                ]
-
                 account_id = None
-                for pattern in account_id_patterns:
-                    match = re.search(pattern, account_label)
+                for pattern in _ACCOUNT_ID_PATTERNS:
+                    match = pattern.search(account_label)
                     if match:
                         account_id = match.group(1).strip()
                         break
@@ -1065,8 +1130,16 @@ class BancoChileScraper(BaseScraper):
 
                 # Click radio button with error handling
                 try:
-                    # Instructions say click twice for this specific site
-                    account_radio.click(click_count=2, delay=100)
+                    if double_click_radio:
+                        account_radio.click(click_count=2, delay=100)
+                    else:
+                        account_radio.click()
+                        if not account_radio.evaluate(_RADIO_CHECKED_SCRIPT):
+                            logger.debug(
+                                "Single click did not select the radio, clicking again"
+                            )
+                            double_click_radio = True
+                            account_radio.click()
                     logger.info(f"Selected account radio button for {account_id}")
                 except Exception as e:
                     logger.warning(
@@ -1079,17 +1152,8 @@ class BancoChileScraper(BaseScraper):
                         continue
 
                 # Click accept button with multiple selectors
-                accept_selectors = [
-                    'bch-button[id="modalPrimaryBtn"] button:has-text("Aceptar")',
-                    'button:has-text("Aceptar")',
-                    'button:has-text("Confirmar")',
-                    'button[type="submit"]',
-                    ".modal-confirm",
-                    "#modalPrimaryBtn",
-                ]
-
                 accept_clicked = self._click_with_fallbacks(
-                    accept_selectors, timeout=5000
+                    self.ACCEPT_SELECTORS, timeout=5000
                 )
                 if not accept_clicked:
                     logger.error("Could not find or click accept button")
@@ -1108,27 +1172,19 @@ class BancoChileScraper(BaseScraper):
                     logger.info("Going back to account selection modal.")
 
                     # Try multiple selectors for "select another account" button/link
-                    account_selection_selectors = [
-                        'button:has-text("Seleccionar otra cuenta")',
-                        'a:has-text("SELECCIONAR OTRA CUENTA")',
-                        'a:has-text("Seleccionar otra cuenta")',
-                        'button:has-text("SELECCIONAR OTRA CUENTA")',
-                        'button:has-text("Cambiar cuenta")',
-                        'a:has-text("Cambiar cuenta")',
-                        '[data-test*="select-account"]',
-                        'a[href*="seleccionar"]',
-                        ".account-selector-link",
-                        "button.change-account",
-                    ]
-
-                    selection_clicked = self._click_with_fallbacks(
-                        account_selection_selectors, timeout=5000
+                    selection_clicked = (
+                        not select_other_account_missing
+                        and self._click_with_fallbacks(
+                            self.SELECT_OTHER_ACCOUNT_SELECTORS, timeout=5000
+                        )
                     )
 
                     if not selection_clicked:
-                        logger.warning(
-                            "Could not find 'select another account' button, trying navigation workaround"
-                        )
+                        if not select_other_account_missing:
+                            logger.warning(
+                                "Could not find 'select another account' button, trying navigation workaround"
+                            )
+                            select_other_account_missing = True
                         # Multiple fallback strategies
                         navigation_successful = False
 
@@ -1187,26 +1243,9 @@ class BancoChileScraper(BaseScraper):
                                 break
 
                     # Wait for account selection modal with improved approach
-                    modal_selectors = [
-                        'h2:has-text("Seleccione una cuenta")',
-                        'h1:has-text("Seleccione una cuenta")',
-                        '.modal-title:has-text("Seleccione")',
-                        'mat-select[name="monedas"]',
-                        ".account-selector",
-                        ".currency-selector",
-                    ]
-
-                    modal_element = None
-                    for selector in modal_selectors:
-                        try:
-                            page.wait_for_selector(selector, timeout=8000)
-                            modal_element = page.locator(selector)
-                            logger.info(
-                                f"Found account selection modal with selector: {selector}"
-                            )
-                            break
-                        except PlaywrightTimeoutError:
-                            continue
+                    modal_element = self._find_element_with_fallbacks(
+                        self.ACCOUNT_MODAL_RETURN_SELECTORS, timeout=self.FORM_TIMEOUT
+                    )
 
                     if not modal_element:
                         logger.warning(
@@ -1215,7 +1254,7 @@ class BancoChileScraper(BaseScraper):
                         # Try waiting a bit longer and check again
                         page.wait_for_timeout(3000)
                         modal_element = self._find_element_with_fallbacks(
-                            modal_selectors, timeout=5000
+                            self.ACCOUNT_MODAL_RETURN_SELECTORS, timeout=5000
                         )
 
                         if not modal_element:
@@ -1232,17 +1271,12 @@ class BancoChileScraper(BaseScraper):
                     # to have the list of accounts ready for the next iteration.
                     if i_account < len(account_labels) - 1:
                         try:
-                            currency_dropdown_selectors = [
-                                'mat-select[name="monedas"]',
-                                ".currency-selector",
-                                'select[name="currency"]',
-                            ]
                             dropdown_clicked = self._click_with_fallbacks(
-                                currency_dropdown_selectors, timeout=5000
+                                self.CURRENCY_DROPDOWN_SELECTORS, timeout=5000
                             )
 
                             if dropdown_clicked:
-                                page.wait_for_timeout(1000)  # Wait for options to load
+                                self._wait_until_visible("mat-option")
                                 option_selectors = [
                                     f'mat-option:has-text("{currency_text}")',
                                     f'option:has-text("{currency_text}")',
@@ -1252,9 +1286,7 @@ class BancoChileScraper(BaseScraper):
                                 )
 
                                 if option_clicked:
-                                    page.wait_for_timeout(
-                                        2000
-                                    )  # Wait for accounts to load
+                                    self._wait_for_account_radios()
                                     logger.info(
                                         f"Reselected currency {currency_text} for next account"
                                     )
@@ -1280,13 +1312,8 @@ class BancoChileScraper(BaseScraper):
 
         try:
             # Navigate to main menu
-            products_selectors = [
-                'button:has-text("Mis Productos")',
-                'a:has-text("Mis Productos")',
-                ".main-menu-products",
-            ]
             products_clicked = self._click_with_fallbacks(
-                products_selectors, timeout=10000
+                self.PRODUCTS_MENU_SELECTORS, timeout=10000
             )
 
             if not products_clicked:
@@ -1296,15 +1323,8 @@ class BancoChileScraper(BaseScraper):
             page.wait_for_timeout(2000)
 
             # Click on "Tarjeta de Crédito" button
-            credit_card_selectors = [
-                'button[id="41300"]:has-text("Tarjeta de Crédito")',
-                'button:has-text("Tarjeta de Crédito")',
-                'a:has-text("Tarjeta de Crédito")',
-                ".credit-card-menu",
-            ]
-
             credit_card_clicked = self._click_with_fallbacks(
-                credit_card_selectors, timeout=10000
+                self.CREDIT_CARD_MENU_SELECTORS, timeout=10000
             )
             if not credit_card_clicked:
                 logger.warning("Could not find 'Tarjeta de Crédito' menu")
@@ -1405,17 +1425,8 @@ class BancoChileScraper(BaseScraper):
             self._save_debug_info(f"09_{section_type}_{tab_name}_tab")
 
             # Check for "no information" message
-            no_data_selectors = [
-                "div.bch-alert:has-text('No existe información')",
-                "div.alert:has-text('No existe')",
-                "div:has-text('No hay movimientos')",
-                "div:has-text('Sin movimientos')",
-                ".no-data",
-                ".empty-state",
-            ]
-
             no_data_element = self._find_element_with_fallbacks(
-                no_data_selectors, timeout=3000
+                self.NO_DATA_SELECTORS, timeout=0
             )
             if no_data_element:
                 logger.info(f"No {tab_name} movements found in {section_type} section")
@@ -1437,25 +1448,13 @@ class BancoChileScraper(BaseScraper):
         self, currency: str, section_type: str
     ) -> List[MovementModel]:
         """Extracts credit card movements from the currently displayed table."""
-        page = self._ensure_page()
         movements: List[MovementModel] = []
 
         try:
             # Wait for table to load
-            table_selectors = [
-                "table.bch-table",
-                "table:has(tbody tr)",
-                ".movements-table",
-            ]
-
-            table_found = False
-            for selector in table_selectors:
-                try:
-                    page.wait_for_selector(selector, timeout=8000)
-                    table_found = True
-                    break
-                except PlaywrightTimeoutError:
-                    continue
+            table_found = self._find_element_with_fallbacks(
+                self.CARD_TABLE_SELECTORS, timeout=self.PAGE_LOAD_TIMEOUT
+            )
 
             if not table_found:
                 logger.info(
@@ -1465,7 +1464,7 @@ class BancoChileScraper(BaseScraper):
 
             # Get table rows (excluding collapse/detail rows)
             row_selector = "table.bch-table tbody tr.bch-row:not(.table-collapse-row)"
-            rows = page.locator(row_selector).all()
+            rows = self._extract_table(row_selector, self.CARD_COLUMNS)
 
             if not rows:
                 logger.info(f"No movement rows found for {currency} in {section_type}")
@@ -1477,83 +1476,19 @@ class BancoChileScraper(BaseScraper):
 
             for i, row in enumerate(rows):
                 try:
-                    # Extract data from row columns based on the HTML structure provided
-                    date_selectors = [
-                        "td.cdk-column-fechaTransaccion",
-                        "td:nth-child(1)",
-                    ]
-                    type_selectors = [
-                        "td.cdk-column-tipoMovimientoLabel",
-                        "td:nth-child(2)",
-                    ]
-                    desc_selectors = ["td.cdk-column-descripcion", "td:nth-child(3)"]
-                    cuotas_selectors = ["td.cdk-column-cuotas", "td:nth-child(4)"]
-                    cargo_selectors = ["td.cdk-column-cargo", "td:nth-child(5)"]
-                    pago_selectors = ["td.cdk-column-pago", "td:nth-child(6)"]
-
-                    # Find elements within this specific row
-                    date_element = None
-                    desc_element = None
-                    tipo_element = None
-                    cuotas_element = None
-                    cargo_element = None
-                    pago_element = None
-
-                    for sel in date_selectors:
-                        candidate = row.locator(sel)
-                        if candidate.count() > 0:
-                            date_element = candidate
-                            break
-
-                    for sel in desc_selectors:
-                        candidate = row.locator(sel)
-                        if candidate.count() > 0:
-                            desc_element = candidate
-                            break
-
-                    for sel in type_selectors:
-                        candidate = row.locator(sel)
-                        if candidate.count() > 0:
-                            tipo_element = candidate
-                            break
-
-                    for sel in cuotas_selectors:
-                        candidate = row.locator(sel)
-                        if candidate.count() > 0:
-                            cuotas_element = candidate
-                            break
-
-                    for sel in cargo_selectors:
-                        candidate = row.locator(sel)
-                        if candidate.count() > 0:
-                            cargo_element = candidate
-                            break
-
-                    for sel in pago_selectors:
-                        candidate = row.locator(sel)
-                        if candidate.count() > 0:
-                            pago_element = candidate
-                            break
-
-                    if not all([date_element, desc_element]):
+                    if row["date"] is None or row["description"] is None:
                         logger.warning(
                             f"Could not find required elements in credit card row {i + 1}"
                         )
                         continue
 
                     # Extract text content
-                    date_str = date_element.inner_text().strip() if date_element else ""
-                    description = (
-                        desc_element.inner_text().strip() if desc_element else ""
-                    )
-                    tipo_str = tipo_element.inner_text().strip() if tipo_element else ""
-                    cuotas_str = (
-                        cuotas_element.inner_text().strip() if cuotas_element else ""
-                    )
-                    cargo_str = (
-                        cargo_element.inner_text().strip() if cargo_element else ""
-                    )
-                    pago_str = pago_element.inner_text().strip() if pago_element else ""
+                    date_str = sys.intern(row["date"])
+                    description = row["description"]
+                    tipo_str = row["tipo"] or ""
+                    cuotas_str = row["cuotas"] or ""
+                    cargo_str = row["cargo"] or ""
+                    pago_str = row["pago"] or ""
 
                     # Parse date
                     date = parse_chilean_date(date_str)
@@ -1606,7 +1541,7 @@ class BancoChileScraper(BaseScraper):
                     account_id = f"credit_card_{currency.lower()}_{section_type}"
 
                     # Create movement
-                    movement = MovementModel(
+                    movement = MovementModel.build(
                         date=date,
                         description=enhanced_desc,
                         amount=amount,
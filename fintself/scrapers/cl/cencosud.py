@@ -12,6 +12,8 @@ class CencosudScraper(BaseScraper):
 
     LOGIN_URL = "https://www.mitarjetacencosud.cl/login"
     DASHBOARD_URL = "https://www.mitarjetacencosud.cl/dashboard"
+    # The login has always typed the password key by key; keep it that way.
+    TYPE_REALISTICALLY = frozenset({"#webt-login-prelogin-input-password"})
 
     def _get_bank_id(self) -> str:
         return "cl_cencosud"
@@ -23,7 +25,11 @@ class CencosudScraper(BaseScraper):
 
         self._ensure_page()
         logger.info("Logging into Cencosud.")
-        self._navigate(self.LOGIN_URL)
+        self._navigate(
+            self.LOGIN_URL,
+            wait_until="commit",
+            wait_for="#webt-login-prelogin-input-rut",
+        )
         self._save_debug_info("01_login_page")
 
         logger.info("Entering credentials.")
@@ -44,14 +50,31 @@ class CencosudScraper(BaseScraper):
                 "Timeout or error after login to Cencosud. Check credentials."
             )
 
+    def _probe_logged_in(self) -> bool:
+        """Checks whether a restored session reaches the dashboard."""
+        try:
+            self._navigate(
+                self.DASHBOARD_URL,
+                timeout_override=10000,
+                wait_until="commit",
+                wait_for="text=Movimientos",
+            )
+        except DataExtractionError:
+            return False
+        return "/login" not in self._ensure_page().url
+
     def _scrape_movements(self) -> List[MovementModel]:
         """Orchestrates the extraction of billed and unbilled movements."""
         self._close_popup()
         unbilled = self._extract_unbilled_movements()
 
         logger.info("Navigating to dashboard to extract billed movements.")
-        self._navigate(self.DASHBOARD_URL, timeout_override=15000)
-        self._wait_for_selector('div[code="MOVIMIENTOS"]', timeout_override=20000)
+        self._navigate(
+            self.DASHBOARD_URL,
+            timeout_override=20000,
+            wait_until="commit",
+            wait_for='div[code="MOVIMIENTOS"]',
+        )
         self._close_popup()
 
         billed = self._extract_billed_movements()
@@ -94,41 +117,44 @@ class CencosudScraper(BaseScraper):
             self._save_debug_info("account_id_extraction_failed_unbilled")
             account_id = "N/A"
 
-        rows = page.locator(".national-movements-content-table .table__body__row").all()
-        movements = []
+        rows = self._extract_table(
+            ".national-movements-content-table .table__body__row",
+            {
+                "date": ".table__body__row__image-column.row-1 > div",
+                "description": ".table__body__row__column.row-2 > div",
+                "amount": ".table__body__row__image-column.row-5 > div",
+            },
+        )
+        records = []
         for row in rows:
-            try:
-                date_str = row.locator(
-                    ".table__body__row__image-column.row-1 > div"
-                ).inner_text()
-                desc = row.locator(".table__body__row__column.row-2 > div").inner_text()
-                amount_str = row.locator(
-                    ".table__body__row__image-column.row-5 > div"
-                ).inner_text()
-
-                date = parse_chilean_date(date_str)
-                if not date:
-                    continue
-
-                movements.append(
-                    MovementModel(
-                        date=date,
-                        description=desc,
-                        amount=-parse_chilean_amount(amount_str),
-                        currency="CLP",
-                        transaction_type="Cargo",
-                        account_id=account_id,
-                        account_type="credito",
-                        raw_data={
-                            "status": "unbilled",
-                            "date_str": date_str,
-                            "amount_str": amount_str,
-                            "full_account_id": account_id,
-                        },
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Error parsing unbilled row: {e}")
+            missing = [column for column, text in row.items() if text is None]
+            if missing:
+                logger.debug(f"Skipping row without {', '.join(missing)} cells.")
+                continue
+            date_str = row["date"]
+            date = parse_chilean_date(date_str)
+            if not date:
+                continue
+            amount_str = row["amount"]
+
+            records.append(
+                {
+                    "date": date,
+                    "description": row["description"],
+                    "amount": -parse_chilean_amount(amount_str),
+                    "currency": "CLP",
+                    "transaction_type": "Cargo",
+                    "account_id": account_id,
+                    "account_type": "credito",
+                    "raw_data": {
+                        "status": "unbilled",
+                        "date_str": date_str,
+                        "amount_str": amount_str,
+                        "full_account_id": account_id,
+                    },
+                }
+            )
+        movements = self._movements_from_records(records)
 
         logger.info(f"Extracted {len(movements)} unbilled movements.")
         return movements
@@ -156,39 +182,44 @@ class CencosudScraper(BaseScraper):
             self._save_debug_info("account_id_extraction_failed_billed")
             account_id = "N/A"
 
-        rows = page.locator(".invoice-table-wrapper .invoice-table__body__row").all()
-        movements = []
+        rows = self._extract_table(
+            ".invoice-table-wrapper .invoice-table__body__row",
+            {
+                "date": ".invoice-row-1 div:nth-child(2)",
+                "description": ".invoice-row-2 > div",
+                "amount": ".invoice-row-5 div > div:last-child",
+            },
+        )
+        records = []
         for row in rows:
-            try:
-                date_str = row.locator(".invoice-row-1 div:nth-child(2)").inner_text()
-                desc = row.locator(".invoice-row-2 > div").inner_text()
-                amount_str = row.locator(
-                    ".invoice-row-5 div > div:last-child"
-                ).inner_text()
-
-                date = parse_chilean_date(date_str)
-                if not date:
-                    continue
-
-                movements.append(
-                    MovementModel(
-                        date=date,
-                        description=desc,
-                        amount=-parse_chilean_amount(amount_str),
-                        currency="CLP",
-                        transaction_type="Cargo",
-                        account_id=account_id,
-                        account_type="credito",
-                        raw_data={
-                            "status": "billed",
-                            "date_str": date_str,
-                            "amount_str": amount_str,
-                            "full_account_id": account_id,
-                        },
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Error parsing billed row: {e}")
+            missing = [column for column, text in row.items() if text is None]
+            if missing:
+                logger.debug(f"Skipping row without {', '.join(missing)} cells.")
+                continue
+            date_str = row["date"]
+            date = parse_chilean_date(date_str)
+            if not date:
+                continue
+            amount_str = row["amount"]
+
+            records.append(
+                {
+                    "date": date,
+                    "description": row["description"],
+                    "amount": -parse_chilean_amount(amount_str),
+                    "currency": "CLP",
+                    "transaction_type": "Cargo",
+                    "account_id": account_id,
+                    "account_type": "credito",
+                    "raw_data": {
+                        "status": "billed",
+                        "date_str": date_str,
+                        "amount_str": amount_str,
+                        "full_account_id": account_id,
+                    },
+                }
+            )
+        movements = self._movements_from_records(records)
 
         logger.info(f"Extracted {len(movements)} billed movements.")
         return movements
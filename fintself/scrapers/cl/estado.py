@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
@@ -8,12 +8,74 @@ from fintself.scrapers.base import BaseScraper
 from fintself.utils.logging import logger
 from fintself.utils.parsers import parse_chilean_amount, parse_chilean_date
 
+# Scrolls to the top and removes the elements matching any of the selectors,
+# returning how many were removed.
+_CLEAR_OVERLAYS_SCRIPT = """(selectors) => {
+    window.scrollTo(0, 0);
+    let removed = 0;
+    for (const element of document.querySelectorAll(selectors.join(", "))) {
+        element.remove();
+        removed++;
+    }
+    return removed;
+}"""
+
 
 class BancoEstadoScraper(BaseScraper):
     """Scraper to extract movements from Banco Estado Chile - CuentaRUT."""
 
     LOGIN_URL = "https://www.bancoestado.cl/content/bancoestado-public/cl/es/home/home.html#/login"
 
+    # Movement table columns, by position among the row's cells:
+    # Tags | Fecha | Descripción | Canal | Abonos/Cargos | Saldos | Descargar
+    MOVEMENT_COLUMNS = {
+        "date": ":scope > td:nth-of-type(2)",
+        "description": ":scope > td:nth-of-type(3)",
+        "canal": ":scope > td:nth-of-type(4)",
+        "amount": ":scope > td:nth-of-type(5)",
+    }
+    MOVEMENTS_BUTTON_SELECTORS = (
+        'button[aria-label*="movimientos de CuentaRUT"]',
+        'button[aria-label*="Saldos y movimientos de CuentaRUT"]',
+        'button:has-text("Ver movimientos")',
+        'button:has-text("Ver detalle")',
+    )
+    # Close buttons of the modals and overlays that may cover the page. Each
+    # list is first checked as a whole, so nothing is probed when none shows.
+    LOGIN_MODAL_CLOSE_SELECTORS = (
+        ".msd-modalhome--container-content-close",
+        ".msd-modalhome--container .close",
+        'span:has-text("X")',
+    )
+    POST_LOGIN_MODAL_CLOSE_SELECTORS = (
+        ".msd-modalhome--container-content-close",
+        'span:has-text("X")',
+        ".msd-sideBar__container button.close",
+        'button[aria-label="Cerrar"]',
+    )
+    OVERLAY_CLOSE_SELECTORS = (
+        ".msd-modalhome--container-content-close",
+        ".msd-modalhome--container .close",
+        'span:has-text("X")',
+        'button[aria-label="Cerrar"]',
+        'button[aria-label="Cerrar modal"]',
+        'button[aria-label="Close"]',
+        'button[aria-label="Close Infobar"]',
+        "button.evg-btn-dismissal",
+        'button:has-text("No por ahora")',
+        ".msd-sideBar__container__header span.close",
+        ".msd-sideBar__container button.close",
+    )
+    # Overlays that do not respond to clicks and are removed from the DOM.
+    STUBBORN_OVERLAY_SELECTORS = (
+        "#remove-modal",
+        "#evg-infobar-with-user-attr",
+        ".evg-infobar-middle",
+        "msd-side-nav.msd-holidays-type-2",
+    )
+    # Shown once the movements page has loaded, with or without movements.
+    MOVEMENTS_PAGE_SELECTOR = 'table tbody tr, .no-data, :text("No hay movimientos"), :text("Sin movimientos")'
+
     def _get_bank_id(self) -> str:
         return "cl_estado"
 
@@ -24,7 +86,11 @@ class BancoEstadoScraper(BaseScraper):
 
         page = self._ensure_page()
         logger.info("Logging into Banco Estado.")
-        self._navigate(self.LOGIN_URL, timeout_override=90000)
+        # The form wait below is the readiness check, so a missing form is
+        # still reported as a LoginError after 20 seconds.
+        self._navigate(
+            self.LOGIN_URL, timeout_override=90000, wait_until="domcontentloaded"
+        )
         self._save_debug_info("01_login_page")
 
         # Wait for login form to load
@@ -50,8 +116,8 @@ class BancoEstadoScraper(BaseScraper):
         logger.info("Entering credentials.")
         # Clean RUT: remove dots and hyphens
         clean_rut = self.user.replace(".", "").replace("-", "")
-        self._type(page.locator("input#rut"), clean_rut, delay=120)
-        self._type(page.locator("input#pass"), self.password, delay=120)
+        self._type(page.locator("input#rut"), clean_rut, delay=20)
+        self._type(page.locator("input#pass"), self.password, delay=20)
         self._save_debug_info("03_credentials_entered")
 
         # Wait a bit to see if a modal appears
@@ -59,13 +125,7 @@ class BancoEstadoScraper(BaseScraper):
 
         # Close any modal that might be blocking the login button
         try:
-            modal_close_selectors = [
-                ".msd-modalhome--container-content-close",
-                ".msd-modalhome--container .close",
-                'span:has-text("X")',
-            ]
-
-            for selector in modal_close_selectors:
+            for selector in self._visible_candidates(self.LOGIN_MODAL_CLOSE_SELECTORS):
                 try:
                     close_btn = page.locator(selector).first
                     if close_btn.is_visible(timeout=2000):
@@ -104,19 +164,17 @@ class BancoEstadoScraper(BaseScraper):
                 "Timeout waiting for post-login. Credentials might be incorrect."
             )
 
-        # Wait a bit for post-login modals/announcements
-        page.wait_for_timeout(3000)
+        # Let post-login modals/announcements load, for at most the old 3s pause
+        try:
+            page.wait_for_load_state("networkidle", timeout=3000)
+        except PlaywrightTimeoutError:
+            pass
 
         # Close any post-login announcement modal
         try:
-            close_btn_selectors = [
-                ".msd-modalhome--container-content-close",
-                'span:has-text("X")',
-                ".msd-sideBar__container button.close",
-                'button[aria-label="Cerrar"]',
-            ]
-
-            for selector in close_btn_selectors:
+            for selector in self._visible_candidates(
+                self.POST_LOGIN_MODAL_CLOSE_SELECTORS
+            ):
                 try:
                     close_btn = page.locator(selector).first
                     if close_btn.is_visible(timeout=2000):
@@ -145,7 +203,12 @@ class BancoEstadoScraper(BaseScraper):
         logger.info("Navigating to CuentaRUT movements")
 
         # Wait for dashboard to load
-        page.wait_for_timeout(5000)
+        try:
+            page.locator(", ".join(self.MOVEMENTS_BUTTON_SELECTORS)).first.wait_for(
+                state="visible", timeout=15000
+            )
+        except PlaywrightTimeoutError:
+            logger.warning("Movimientos button not visible on the dashboard yet.")
         self._save_debug_info("05_dashboard")
 
         # Close any banners that might block interactions on the dashboard
@@ -153,14 +216,7 @@ class BancoEstadoScraper(BaseScraper):
 
         # Click on "Movimientos" button for CuentaRUT
         def _click_movements_button() -> None:
-            button_selectors = [
-                'button[aria-label*="movimientos de CuentaRUT"]',
-                'button[aria-label*="Saldos y movimientos de CuentaRUT"]',
-                'button:has-text("Ver movimientos")',
-                'button:has-text("Ver detalle")',
-            ]
-
-            for button_selector in button_selectors:
+            for button_selector in self.MOVEMENTS_BUTTON_SELECTORS:
                 locator = page.locator(button_selector).first
                 try:
                     if locator.is_visible(timeout=2000):
@@ -178,7 +234,7 @@ class BancoEstadoScraper(BaseScraper):
             self._save_debug_info("06_clicked_movimientos")
 
             # Wait for movements page to load
-            page.wait_for_timeout(8000)
+            self._wait_for_movements_page()
             self._save_debug_info("07_movements_page")
 
         except Exception as e:
@@ -187,7 +243,7 @@ class BancoEstadoScraper(BaseScraper):
             try:
                 _click_movements_button()
                 self._save_debug_info("06_clicked_movimientos_retry")
-                page.wait_for_timeout(8000)
+                self._wait_for_movements_page()
                 self._save_debug_info("07_movements_page")
             except Exception as retry_error:
                 logger.error(f"Error navigating to movements: {retry_error}")
@@ -208,30 +264,44 @@ class BancoEstadoScraper(BaseScraper):
         logger.info(f"Total movements extracted: {len(all_movements)}")
         return all_movements
 
+    def _wait_for_movements_page(self) -> None:
+        """Waits for the movements table or its no-data message to show up."""
+        try:
+            self._ensure_page().wait_for_selector(
+                self.MOVEMENTS_PAGE_SELECTOR, timeout=15000
+            )
+        except PlaywrightTimeoutError:
+            logger.warning("Movements page did not show a table or message yet.")
+
+    def _visible_candidates(self, selectors: Sequence[str]) -> Sequence[str]:
+        """
+        Returns the selectors to probe one by one, or none at all when a single
+        combined query finds none of them visible.
+        """
+        try:
+            combined = self._ensure_page().locator(", ".join(selectors))
+            if combined.locator("visible=true").count() == 0:
+                return ()
+        except Exception as e:
+            logger.debug(f"Combined visibility check failed: {e}")
+        return selectors
+
     def _dismiss_annoyances(self, context: str = "") -> None:
         """Attempts to close or remove overlays that block interactions."""
         page = self._ensure_page()
 
+        # Scroll to the top and remove stubborn overlays that do not respond to
+        # clicks, both in a single call.
         try:
-            page.evaluate("window.scrollTo(0, 0)")
+            removed = page.evaluate(
+                _CLEAR_OVERLAYS_SCRIPT, list(self.STUBBORN_OVERLAY_SELECTORS)
+            )
+            if removed:
+                logger.debug(f"Removed {removed} stubborn overlays")
         except Exception:
             pass
 
-        selectors_to_try = [
-            ".msd-modalhome--container-content-close",
-            ".msd-modalhome--container .close",
-            'span:has-text("X")',
-            'button[aria-label="Cerrar"]',
-            'button[aria-label="Cerrar modal"]',
-            'button[aria-label="Close"]',
-            'button[aria-label="Close Infobar"]',
-            "button.evg-btn-dismissal",
-            'button:has-text("No por ahora")',
-            ".msd-sideBar__container__header span.close",
-            ".msd-sideBar__container button.close",
-        ]
-
-        for selector in selectors_to_try:
+        for selector in self._visible_candidates(self.OVERLAY_CLOSE_SELECTORS):
             try:
                 locator = page.locator(selector).first
                 if locator.is_visible(timeout=1500):
@@ -251,26 +321,6 @@ class BancoEstadoScraper(BaseScraper):
         except Exception:
             pass
 
-        # Remove stubborn overlays that do not respond to clicks
-        try:
-            page.evaluate(
-                """
-                const selectors = [
-                    '#remove-modal',
-                    '#evg-infobar-with-user-attr',
-                    '.evg-infobar-middle',
-                    'msd-side-nav.msd-holidays-type-2',
-                ];
-                selectors.forEach((selector) => {
-                    document.querySelectorAll(selector).forEach((element) => {
-                        element.remove();
-                    });
-                });
-                """
-            )
-        except Exception:
-            pass
-
     def _extract_movements_from_page(self) -> List[MovementModel]:
         """Extracts movements from the movements page."""
         page = self._ensure_page()
@@ -323,25 +373,20 @@ class BancoEstadoScraper(BaseScraper):
 
         # Extract rows from table
         try:
-            rows = page.locator("table tbody tr").all()
+            # All cells are read in one round-trip instead of one per cell
+            rows = self._extract_table("table tbody tr", self.MOVEMENT_COLUMNS)
             logger.info(f"Found {len(rows)} rows in movements table")
 
             for i, row in enumerate(rows):
                 try:
-                    # Get all cells in the row
-                    cells = row.locator("td").all()
-
-                    if len(cells) < 5:
+                    if row["amount"] is None:
                         logger.debug(f"Row {i + 1} has less than 5 cells, skipping")
                         continue
 
-                    # Extract data from cells
-                    # Structure: Tags | Fecha | Descripción | Canal | Abonos/Cargos | Saldos | Descargar
-                    # Index:     0    | 1     | 2           | 3     | 4             | 5      | 6
-                    date_str = cells[1].inner_text().strip()
-                    description = cells[2].inner_text().strip()
-                    canal = cells[3].inner_text().strip()
-                    amount_str = cells[4].inner_text().strip()
+                    date_str = row["date"]
+                    description = row["description"]
+                    canal = row["canal"]
+                    amount_str = row["amount"]
 
                     # Parse date
                     if not date_str:
@@ -369,7 +414,7 @@ class BancoEstadoScraper(BaseScraper):
                     transaction_type = "Cargo" if amount < 0 else "Abono"
 
                     # Create movement
-                    movement = MovementModel(
+                    movement = MovementModel.build(
                         date=date,
                         description=description,
                         amount=amount,
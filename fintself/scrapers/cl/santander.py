@@ -10,6 +10,12 @@ from fintself.scrapers.base import BaseScraper
 from fintself.utils.logging import logger
 from fintself.utils.parsers import parse_chilean_amount, parse_chilean_date
 
+# Last four digits of a masked card number, e.g. "**** 1234".
+_LAST_FOUR_DIGITS = re.compile(r"\*\s*(\d{4})")
+_NON_DIGITS = re.compile(r"\D")
+# Classes of the selected currency toggle.
+_TOGGLE_CHECKED = re.compile(r"mat-button-toggle-checked|actived")
+
 
 class SantanderScraper(BaseScraper):
     """Scraper to extract movements from Banco Santander Chile."""
@@ -29,7 +35,12 @@ class SantanderScraper(BaseScraper):
 
         page = self._ensure_page()
         logger.info("Navigating to Santander login page.")
-        self._navigate(self.LOGIN_URL, timeout_override=90000)
+        self._navigate(
+            self.LOGIN_URL,
+            timeout_override=90000,
+            wait_until="commit",
+            wait_for='role=button[name="Ingresar al sitio privado"]',
+        )
         self._save_debug_info("01_login_page")
 
         logger.info("Clicking on 'Ingresar al sitio privado' button.")
@@ -47,11 +58,9 @@ class SantanderScraper(BaseScraper):
             raise LoginError("Timeout waiting for Santander login iframe.")
 
         logger.info("Entering credentials.")
+        self._type(login_frame.locator('role=textbox[name="RUT"]'), self.user, delay=20)
         self._type(
-            login_frame.locator('role=textbox[name="RUT"]'), self.user, delay=120
-        )
-        self._type(
-            login_frame.locator('role=textbox[name="Clave"]'), self.password, delay=120
+            login_frame.locator('role=textbox[name="Clave"]'), self.password, delay=20
         )
         self._save_debug_info("02_credentials_entered")
 
@@ -69,6 +78,19 @@ class SantanderScraper(BaseScraper):
                 "Timeout or error after login to Santander. Credentials might be incorrect."
             )
 
+    def _probe_logged_in(self) -> bool:
+        """Checks whether a restored session reaches the private home page."""
+        try:
+            self._navigate(
+                self.DASHBOARD_URL,
+                timeout_override=15000,
+                wait_until="commit",
+                wait_for="h3:has-text('Hola')",
+            )
+        except DataExtractionError:
+            return False
+        return True
+
     def _get_all_credit_cards_from_carousel(self) -> List[str]:
         """Extracts all credit card IDs from the carousel on the credit card pages.
 
@@ -93,7 +115,7 @@ class SantanderScraper(BaseScraper):
                     # The format is "* XXXX" inside a <p> with class "product"
                     product_text = slide.locator("p.product").inner_text(timeout=2000)
                     # Extract the 4 digits
-                    match = re.search(r"\*\s*(\d{4})", product_text)
+                    match = _LAST_FOUR_DIGITS.search(product_text)
                     if match:
                         card_id = f"**** {match.group(1)}"
                         if card_id not in card_ids:
@@ -171,7 +193,7 @@ class SantanderScraper(BaseScraper):
             for div in account_divs:
                 name_p = div.locator("div.datos p").first.inner_text(timeout=2000)
                 number_raw = div.locator("div.datos p").nth(1).inner_text(timeout=2000)
-                number_clean = re.sub(r"[^\d]", "", number_raw)
+                number_clean = _NON_DIGITS.sub("", number_raw)
 
                 if "dólar" in name_p.lower():
                     self.account_ids["corriente"]["USD"] = number_clean
@@ -191,7 +213,7 @@ class SantanderScraper(BaseScraper):
                 first_card = card_divs[0]
                 card_number_p = first_card.locator("p:has-text('*')")
                 card_text = card_number_p.inner_text(timeout=2000)
-                match = re.search(r"\*\s*(\d{4})", card_text)
+                match = _LAST_FOUR_DIGITS.search(card_text)
                 if match:
                     card_id = f"**** {match.group(1)}"
                     # Assume same ID for both currencies, as the site seems to have one context per card.
@@ -330,9 +352,7 @@ class SantanderScraper(BaseScraper):
             self._click(f'button:has-text("{target_tab}")')
             expect(
                 page.locator(f'mat-button-toggle:has-text("{target_tab}")')
-            ).to_have_class(
-                re.compile(r"mat-button-toggle-checked|actived"), timeout=15000
-            )
+            ).to_have_class(_TOGGLE_CHECKED, timeout=15000)
             page.wait_for_timeout(2000)  # Wait for content to load
         except (PlaywrightTimeoutError, DataExtractionError):
             self._save_debug_info(f"currency_switch_timeout_{currency}")
@@ -370,8 +390,12 @@ class SantanderScraper(BaseScraper):
         # CLP Checking Account
         try:
             logger.info("Navigating to dashboard for CLP Checking Account movements...")
-            self._navigate(self.DASHBOARD_URL, timeout_override=60000)
-            expect(page.locator("h3:has-text('Hola')")).to_be_visible(timeout=40000)
+            self._navigate(
+                self.DASHBOARD_URL,
+                timeout_override=60000,
+                wait_until="commit",
+                wait_for="h3:has-text('Hola')",
+            )
             self._save_debug_info("06_dashboard_for_debit_clp")
 
             logger.info("Navigating to CLP Checking Account movements...")
@@ -398,8 +422,12 @@ class SantanderScraper(BaseScraper):
         # USD Checking Account
         try:
             logger.info("Navigating to dashboard for USD Checking Account movements...")
-            self._navigate(self.DASHBOARD_URL, timeout_override=60000)
-            expect(page.locator("h3:has-text('Hola')")).to_be_visible(timeout=40000)
+            self._navigate(
+                self.DASHBOARD_URL,
+                timeout_override=60000,
+                wait_until="commit",
+                wait_for="h3:has-text('Hola')",
+            )
             self._save_debug_info("08_dashboard_for_debit_usd")
 
             logger.info("Navigating to USD Checking Account movements...")
@@ -428,7 +456,6 @@ class SantanderScraper(BaseScraper):
 
     def _extract_debit_card_movements(self, currency: str) -> List[MovementModel]:
         """Extracts debit card (checking account) movements from the current page."""
-        page = self._ensure_page()
         logger.info(f"Extracting debit card movements in {currency}...")
         account_id = self._get_account_id(account_type="corriente", currency=currency)
         container_selector = "div.card.table-container.show"
@@ -441,76 +468,76 @@ class SantanderScraper(BaseScraper):
             )
             return []
 
-        rows = page.locator(
-            f"{container_selector} table.mat-table tbody tr.mat-row"
-        ).all()
+        rows = self._extract_table(
+            f"{container_selector} table.mat-table tbody tr.mat-row",
+            {
+                "date": "td.mat-column-date",
+                "description": "td.mat-column-detail",
+                "charge": "td.mat-column-amountCharge",
+                "payment": "td.mat-column-paymentAmount",
+            },
+        )
         if not rows:
             logger.info(f"No debit card movements found in {currency}.")
             return []
 
-        movements = []
+        records = []
         last_date_str = ""
 
         for row in rows:
+            # A missing cell means the row is not a movement; an empty date
+            # cell means it shares the date of the row above.
+            missing = [column for column, text in row.items() if text is None]
+            if missing:
+                logger.debug(
+                    f"Skipping debit card row without {', '.join(missing)} cells."
+                )
+                continue
+
             raw_movement = {}
             if account_id:
                 raw_movement["full_account_id"] = account_id
 
-            try:
-                date_text = (
-                    row.locator("td.mat-column-date").inner_text(timeout=5000).strip()
-                )
-                if date_text:
-                    last_date_str = date_text
+            date_text = row["date"]
+            if date_text:
+                last_date_str = date_text
 
-                raw_movement["date"] = last_date_str
-                raw_movement["description"] = (
-                    row.locator("td.mat-column-detail").inner_text(timeout=5000).strip()
-                )
-
-                charge_str = (
-                    row.locator("td.mat-column-amountCharge")
-                    .inner_text(timeout=5000)
-                    .strip()
-                )
-                payment_str = (
-                    row.locator("td.mat-column-paymentAmount")
-                    .inner_text(timeout=5000)
-                    .strip()
-                )
+            raw_movement["date"] = last_date_str
+            raw_movement["description"] = row["description"]
 
-                # For debit, charges are negative, payments are positive.
-                if charge_str and charge_str not in ["0", ""]:
-                    raw_movement["amount"] = f"-{charge_str}"
-                elif payment_str and payment_str not in ["0", ""]:
-                    raw_movement["amount"] = payment_str
-                else:
-                    raw_movement["amount"] = "0"
+            charge_str = row["charge"]
+            payment_str = row["payment"]
 
-                parsed_date = parse_chilean_date(raw_movement.get("date"))
-                if not parsed_date:
-                    continue
+            # For debit, charges are negative, payments are positive.
+            if charge_str and charge_str not in ["0", ""]:
+                raw_movement["amount"] = f"-{charge_str}"
+            elif payment_str and payment_str not in ["0", ""]:
+                raw_movement["amount"] = payment_str
+            else:
+                raw_movement["amount"] = "0"
 
-                amount = parse_chilean_amount(raw_movement.get("amount"))
-                if amount.is_zero():
-                    continue
+            parsed_date = parse_chilean_date(raw_movement.get("date"))
+            if not parsed_date:
+                continue
 
-                movements.append(
-                    MovementModel(
-                        date=parsed_date,
-                        description=raw_movement.get("description", ""),
-                        amount=amount,
-                        currency=currency,
-                        transaction_type="Cargo" if amount < 0 else "Abono",
-                        account_id=account_id,
-                        account_type="corriente",
-                        raw_data=raw_movement,
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Error parsing a debit card movement row: {e}")
+            amount = parse_chilean_amount(raw_movement.get("amount"))
+            if amount.is_zero():
                 continue
 
+            records.append(
+                {
+                    "date": parsed_date,
+                    "description": raw_movement.get("description", ""),
+                    "amount": amount,
+                    "currency": currency,
+                    "transaction_type": "Cargo" if amount < 0 else "Abono",
+                    "account_id": account_id,
+                    "account_type": "corriente",
+                    "raw_data": raw_movement,
+                }
+            )
+
+        movements = self._movements_from_records(records)
         logger.info(f"Extracted {len(movements)} debit card movements in {currency}.")
         return movements
 
@@ -518,7 +545,6 @@ class SantanderScraper(BaseScraper):
         self, status: str, currency: str
     ) -> List[MovementModel]:
         """Extracts credit card movements from the current page."""
-        page = self._ensure_page()
         logger.info(f"Extracting {status} movements in {currency}...")
         account_id = self._get_account_id(account_type="credito", currency=currency)
         container_selector = (
@@ -535,88 +561,86 @@ class SantanderScraper(BaseScraper):
             )
             return []
 
-        rows = page.locator(
-            f"{container_selector} table.mat-table tbody tr.mat-row"
-        ).all()
+        rows = self._extract_table(
+            f"{container_selector} table.mat-table tbody tr.mat-row",
+            {
+                "date": "td.mat-column-date",
+                "description": "td.mat-column-detail",
+                "charge": "td.mat-column-amountCharge",
+                "payment": "td.mat-column-paymentAmount",
+                "amount": "td.mat-column-amount",
+            },
+        )
         if not rows:
             logger.info(f"No {status} movements found in {currency}.")
             return []
 
-        movements = []
+        records = []
         last_date_str = ""
+        required = ("date", "description") + (
+            ("charge", "payment") if status == "no_facturados" else ("amount",)
+        )
 
         for row in rows:
+            # A missing cell means the row is not a movement; an empty date
+            # cell means it shares the date of the row above.
+            missing = [column for column in required if row[column] is None]
+            if missing:
+                logger.debug(
+                    f"Skipping {status} row without {', '.join(missing)} cells."
+                )
+                continue
+
             raw_movement = {}
             if account_id:
                 raw_movement["full_account_id"] = account_id
 
-            try:
-                date_text = (
-                    row.locator("td.mat-column-date").inner_text(timeout=5000).strip()
-                )
-                if date_text:
-                    last_date_str = date_text
+            date_text = row["date"]
+            if date_text:
+                last_date_str = date_text
 
-                raw_movement["date"] = last_date_str
-                raw_movement["description"] = (
-                    row.locator("td.mat-column-detail").inner_text(timeout=5000).strip()
-                )
+            raw_movement["date"] = last_date_str
+            raw_movement["description"] = row["description"]
 
-                if status == "no_facturados":
-                    charge = (
-                        row.locator("td.mat-column-amountCharge")
-                        .inner_text(timeout=5000)
-                        .strip()
-                    )
-                    payment = (
-                        row.locator("td.mat-column-paymentAmount")
-                        .inner_text(timeout=5000)
-                        .strip()
-                    )
-                    raw_movement["amount"] = (
-                        f"-{charge}" if charge and charge not in ["0", ""] else payment
-                    )
+            if status == "no_facturados":
+                charge = row["charge"]
+                payment = row["payment"]
+                raw_movement["amount"] = (
+                    f"-{charge}" if charge and charge not in ["0", ""] else payment
+                )
+            else:
+                # For billed movements, Santander shows:
+                # - Expenses (gastos) as positive values - we need them negative
+                # - Refunds (reembolsos) as negative values - we need them positive
+                # So we invert the sign to match the expected behavior
+                amount_text = row["amount"]
+                # Parse the amount to check if it's positive or negative
+                if amount_text.startswith("-"):
+                    # Negative amount (refund) - make it positive
+                    raw_movement["amount"] = amount_text[1:]  # Remove the minus sign
                 else:
-                    # For billed movements, Santander shows:
-                    # - Expenses (gastos) as positive values - we need them negative
-                    # - Refunds (reembolsos) as negative values - we need them positive
-                    # So we invert the sign to match the expected behavior
-                    amount_text = (
-                        row.locator("td.mat-column-amount")
-                        .inner_text(timeout=5000)
-                        .strip()
-                    )
-                    # Parse the amount to check if it's positive or negative
-                    if amount_text.startswith("-"):
-                        # Negative amount (refund) - make it positive
-                        raw_movement["amount"] = amount_text[
-                            1:
-                        ]  # Remove the minus sign
-                    else:
-                        # Positive amount (expense) - make it negative
-                        raw_movement["amount"] = f"-{amount_text}"
-
-                parsed_date = parse_chilean_date(raw_movement.get("date"))
-                if not parsed_date:
-                    continue
+                    # Positive amount (expense) - make it negative
+                    raw_movement["amount"] = f"-{amount_text}"
 
-                amount = parse_chilean_amount(raw_movement.get("amount"))
-
-                movements.append(
-                    MovementModel(
-                        date=parsed_date,
-                        description=raw_movement.get("description", ""),
-                        amount=amount,
-                        currency=currency,
-                        transaction_type="Cargo" if amount < 0 else "Abono",
-                        account_id=account_id,
-                        account_type="credito",
-                        raw_data=raw_movement,
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Error parsing a movement row: {e}")
+            parsed_date = parse_chilean_date(raw_movement.get("date"))
+            if not parsed_date:
                 continue
 
+            amount = parse_chilean_amount(raw_movement.get("amount"))
+
+            records.append(
+                {
+                    "date": parsed_date,
+                    "description": raw_movement.get("description", ""),
+                    "amount": amount,
+                    "currency": currency,
+                    "transaction_type": "Cargo" if amount < 0 else "Abono",
+                    "account_id": account_id,
+                    "account_type": "credito",
+                    "raw_data": raw_movement,
+                }
+            )
+
+        movements = self._movements_from_records(records)
         logger.info(f"Extracted {len(movements)} {status} movements in {currency}.")
         return movements
@@ -9,6 +9,14 @@ load_dotenv(override=True)
 # Enable debug file generation for scrapers. Set to "true" to enable.
 DEBUG = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes")
 
+# Capture the whole scrollable page in debug screenshots instead of only the
+# viewport. Much slower and larger; meant for deep-debug sessions.
+SCRAPER_DEBUG_FULLPAGE = os.getenv("SCRAPER_DEBUG_FULLPAGE", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
 # Determines if browser automation runs in headless mode.
 # Set to "true", "1", or "yes" for headless, otherwise defaults to non-headless (False).
 # Note: Headless mode may not work properly with some banks. Visible mode is recommended.
@@ -38,3 +46,27 @@ SCRAPER_MIN_HUMAN_DELAY_MS = float(
 SCRAPER_MAX_HUMAN_DELAY_MS = float(
     os.getenv("SCRAPER_MAX_HUMAN_DELAY_MS", "800.0")
 )  # ms
+# Skip all human-like pauses between actions. Faster, but easier to detect.
+SCRAPER_HUMAN_DELAY_DISABLED = os.getenv(
+    "SCRAPER_HUMAN_DELAY_DISABLED", "false"
+).lower() in ("true", "1", "yes")
+# Per-keystroke delay used when typing into inputs. If unset, each scraper
+# keeps its own delays; set to 0 to type as fast as possible.
+_type_delay_env = os.getenv("SCRAPER_TYPE_DELAY_MS")
+SCRAPER_TYPE_DELAY_MS = (
+    int(_type_delay_env)
+    if _type_delay_env is not None and _type_delay_env.isdigit()
+    else None
+)  # ms
+
+# Browser pool: idle browsers kept per launch configuration, and number of
+# scrapes after which a pooled browser is relaunched (0 means never).
+SCRAPER_POOL_SIZE = int(os.getenv("SCRAPER_POOL_SIZE", "1"))
+SCRAPER_MAX_USES_PER_INSTANCE = int(os.getenv("SCRAPER_MAX_USES_PER_INSTANCE", "0"))
+
+# Session reuse: directory where each bank's logged-in browser state (cookies
+# and local storage) is saved after a successful login, so the next scrape can
+# skip the login form. Disabled when empty. The files grant access to the
+# bank session, so keep the directory private.
+SCRAPER_STATE_DIR = os.getenv("SCRAPER_STATE_DIR", "")
+SCRAPER_STATE_TTL_SECONDS = int(os.getenv("SCRAPER_STATE_TTL_SECONDS", "600"))
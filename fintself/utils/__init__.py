@@ -1,7 +1,13 @@
+# Output helpers are resolved lazily (PEP 562) so importing the logger or the
+# parsers does not pull in pandas until something is actually written.
+from typing import TYPE_CHECKING, Any
+
 from .logging import logger
-from .output import get_output_data, save_to_csv, save_to_json, save_to_xlsx
 from .parsers import parse_chilean_amount, parse_chilean_date
 
+if TYPE_CHECKING:
+    from .output import get_output_data, save_to_csv, save_to_json, save_to_xlsx
+
 __all__ = [
     "logger",
     "get_output_data",
@@ -11,3 +17,13 @@ __all__ = [
     "parse_chilean_amount",
     "parse_chilean_date",
 ]
+
+_OUTPUT_NAMES = {"get_output_data", "save_to_csv", "save_to_json", "save_to_xlsx"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _OUTPUT_NAMES:
+        from . import output
+
+        return getattr(output, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
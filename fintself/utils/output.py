@@ -1,72 +1,188 @@
-import json
+import itertools
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
 from decimal import Decimal
-from typing import List
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List
 
-import pandas as pd
+from pydantic import TypeAdapter
 
-from fintself.core.exceptions import OutputError
+from fintself.core.exceptions import FintselfException, OutputError
 from fintself.core.models import MovementModel
 from fintself.utils.logging import logger
 
+# pandas and openpyxl are imported by the functions that use them: loading
+# them is most of the import time of this module, and each output format
+# only needs one of them (JSON needs neither).
+if TYPE_CHECKING:
+    import pandas as pd
 
-def _movements_to_dataframe(movements: List[MovementModel]) -> pd.DataFrame:
-    """Converts a list of MovementModel to a Pandas DataFrame."""
-    if not movements:
-        return pd.DataFrame()
+# Serializes a whole list of movements in one pass through pydantic-core,
+# avoiding the intermediate per-model dicts of ``model_dump``.
+_MOVEMENTS_ADAPTER = TypeAdapter(List[MovementModel])
+
+# Number of movements converted and written per DataFrame chunk.
+_BATCH_SIZE = 1000
+
+# Decimal fields of a movement, written as floats in tabular formats.
+_DECIMAL_COLUMNS = [
+    name
+    for name, field in MovementModel.model_fields.items()
+    if field.annotation is Decimal
+]
+
+# Number format of date cells in XLSX files, the same one pandas uses.
+_XLSX_DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+
+
+def _movements_to_dataframe(movements: Iterable[MovementModel]) -> "pd.DataFrame":
+    """Converts an iterable of MovementModel to a Pandas DataFrame."""
+    import pandas as pd
 
     data = [m.model_dump() for m in movements]
-    for row in data:
-        for key, value in row.items():
-            if isinstance(value, Decimal):
-                row[key] = float(value)
-    return pd.DataFrame(data)
+    if not data:
+        return pd.DataFrame()
+
+    df = pd.DataFrame(data)
+    # Converted one column at a time rather than value by value.
+    for column in _DECIMAL_COLUMNS:
+        df[column] = df[column].astype(float)
+    return df
+
+
+def _iter_batches(
+    movements: Iterable[MovementModel], size: int = _BATCH_SIZE
+) -> Iterator[List[MovementModel]]:
+    """Splits movements into lists of at most ``size`` items."""
+    it = iter(movements)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+def _xlsx_cell(sheet: Any, value: Any) -> Any:
+    """Converts a movement field to a value an XLSX cell can hold."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        from openpyxl.cell import WriteOnlyCell
+
+        cell = WriteOnlyCell(sheet, value)
+        cell.number_format = _XLSX_DATETIME_FORMAT
+        return cell
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
 
+@contextmanager
+def _atomic_output(file_path: str) -> Iterator[str]:
+    """Yields a temporary path next to ``file_path`` that replaces it on success.
 
-def save_to_xlsx(movements: List[MovementModel], file_path: str):
-    """Saves a list of movements to an XLSX file."""
+    Movements are written while the scraper is still running, so a scrape
+    that fails halfway would otherwise leave a truncated file behind, or
+    clobber the output of a previous run.
+    """
+    directory, name = os.path.split(file_path)
+    tmp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
     try:
-        df = _movements_to_dataframe(movements)
-        df.to_excel(file_path, index=False, engine="openpyxl")
+        yield tmp_path
+        os.replace(tmp_path, file_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _iter_json_chunks(movements: Iterable[MovementModel]) -> Iterator[bytes]:
+    """Yields a JSON array of movements piece by piece.
+
+    The output is identical to encoding the whole list with an indent of 4,
+    but movements are encoded one batch at a time, each in a single
+    pydantic-core call.
+    """
+    empty = True
+    for batch in _iter_batches(movements):
+        yield b"[\n" if empty else b",\n"
+        empty = False
+        # Strip the enclosing "[\n" and "\n]" so batches can be spliced.
+        yield _MOVEMENTS_ADAPTER.dump_json(batch, indent=4)[2:-2]
+    yield b"[]" if empty else b"\n]"
+
+
+def save_to_xlsx(movements: Iterable[MovementModel], file_path: str):
+    """Saves movements to an XLSX file, streaming rows as they are consumed.
+
+    The workbook is written in openpyxl's write-only mode, so rows go
+    straight to disk instead of being kept in memory until the file is saved.
+    """
+    from openpyxl import Workbook
+
+    try:
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        header = True
+        for movement in movements:
+            row = movement.model_dump()
+            if header:
+                sheet.append(list(row))
+                header = False
+            sheet.append([_xlsx_cell(sheet, value) for value in row.values()])
+        with _atomic_output(file_path) as tmp_path:
+            workbook.save(tmp_path)
         logger.info(f"Data saved to XLSX: {file_path}")
+    except FintselfException:
+        # Raised by the scraper while movements are consumed; not an output
+        # problem, so it is passed on unchanged.
+        raise
     except Exception as e:
         logger.error(f"Error saving to XLSX: {e}", exc_info=True)
         raise OutputError(f"Could not save XLSX file: {e}")
 
 
-def save_to_csv(movements: List[MovementModel], file_path: str):
-    """Saves a list of movements to a CSV file."""
+def save_to_csv(movements: Iterable[MovementModel], file_path: str):
+    """Saves movements to a CSV file, appending them in batches."""
     try:
-        df = _movements_to_dataframe(movements)
-        df.to_csv(file_path, index=False, encoding="utf-8")
+        with _atomic_output(file_path) as tmp_path:
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                header = True
+                for batch in _iter_batches(movements):
+                    _movements_to_dataframe(batch).to_csv(f, index=False, header=header)
+                    header = False
+                if header:
+                    _movements_to_dataframe([]).to_csv(f, index=False)
         logger.info(f"Data saved to CSV: {file_path}")
+    except FintselfException:
+        raise
     except Exception as e:
         logger.error(f"Error saving to CSV: {e}", exc_info=True)
         raise OutputError(f"Could not save CSV file: {e}")
 
 
-def save_to_json(movements: List[MovementModel], file_path: str):
-    """Saves a list of movements to a JSON file."""
+def save_to_json(movements: Iterable[MovementModel], file_path: str):
+    """Saves movements to a JSON file, writing them as they are consumed."""
     try:
-        data = [m.model_dump(mode="json") for m in movements]
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        with _atomic_output(file_path) as tmp_path:
+            with open(tmp_path, "wb") as f:
+                for chunk in _iter_json_chunks(movements):
+                    f.write(chunk)
         logger.info(f"Data saved to JSON: {file_path}")
+    except FintselfException:
+        raise
     except Exception as e:
         logger.error(f"Error saving to JSON: {e}", exc_info=True)
         raise OutputError(f"Could not save JSON file: {e}")
 
 
-def get_output_data(movements: List[MovementModel], output_format: str) -> str:
+def get_output_data(movements: Iterable[MovementModel], output_format: str) -> str:
     """
     Returns the data in the specified format (JSON string or CSV string).
     """
+    movements = list(movements)
     if not movements:
         return ""
 
     if output_format == "json":
-        return json.dumps(
-            [m.model_dump(mode="json") for m in movements], ensure_ascii=False, indent=4
-        )
+        return _MOVEMENTS_ADAPTER.dump_json(movements, indent=4).decode("utf-8")
     elif output_format == "csv":
         df = _movements_to_dataframe(movements)
         return df.to_csv(index=False)
@@ -1,10 +1,24 @@
 import re
+from functools import lru_cache
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from typing import Optional
 
 from .logging import logger
 
+# Currency symbols and whitespace stripped from amounts before parsing.
+_AMOUNT_NOISE = re.compile(r"(?i)USD|\$|\s")
+
+# Decimal is immutable, so every invalid or empty amount can share one zero.
+_ZERO = Decimal(0)
+
+# Common Chilean date formats that include the year.
+_FULL_DATE_FORMATS = ("%d/%m/%Y", "%d-%m-%Y", "%d/%m/%y", "%d-%m-%y")
+
+# Statements repeat the same dates and amounts across many rows. Parsed values
+# are immutable, so repeated strings are parsed once and the results shared.
+_PARSE_CACHE_SIZE = 4096
+
 
 def parse_chilean_amount(amount_str: Optional[str]) -> Decimal:
     """Parses a Chilean-formatted amount string into a Decimal.
@@ -20,12 +34,24 @@ def parse_chilean_amount(amount_str: Optional[str]) -> Decimal:
         Decimal: The parsed amount. Returns 0 if the string is invalid.
     """
     if not amount_str:
-        return Decimal("0")
+        return _ZERO
+
+    amount = _parse_amount(amount_str)
+    if amount is None:
+        # Logged here rather than in the cached parser, so that every
+        # unparseable cell is reported and not only the first one.
+        logger.warning(f"Could not parse amount: '{amount_str}'. Returning 0.")
+        return _ZERO
+    return amount
+
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_amount(amount_str: str) -> Optional[Decimal]:
+    """Parses a non-empty amount string, or returns None if it is invalid."""
     # Clean string: remove currency symbols, whitespace, etc.
     cleaned_str = amount_str.strip()
     # Also remove any whitespace from the string.
-    cleaned_str = re.sub(r"(?i)USD|\$|\s", "", cleaned_str)
+    cleaned_str = _AMOUNT_NOISE.sub("", cleaned_str)
 
     # Handle multiple hyphens from string concatenation (e.g., f"-{'-100'}")
     if cleaned_str.startswith("--"):
@@ -41,13 +67,12 @@ def parse_chilean_amount(amount_str: Optional[str]) -> Decimal:
         cleaned_str = cleaned_str.replace(".", "")
 
     if not cleaned_str:
-        return Decimal("0")
+        return _ZERO
 
     try:
         return Decimal(cleaned_str)
     except InvalidOperation:
-        logger.warning(f"Could not parse amount: '{amount_str}'. Returning 0.")
-        return Decimal("0")
+        return None
 
 
 def parse_chilean_date(date_str: Optional[str]) -> Optional[datetime]:
@@ -67,15 +92,11 @@ def parse_chilean_date(date_str: Optional[str]) -> Optional[datetime]:
         return None
 
     date_str = date_str.strip()
-    # Common Chilean formats with year
-    full_date_formats = ["%d/%m/%Y", "%d-%m-%Y", "%d/%m/%y", "%d-%m-%y"]
-    for fmt in full_date_formats:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
+    parsed_full_date = _parse_full_date(date_str)
+    if parsed_full_date is not None:
+        return parsed_full_date
 
-    # Try parsing DD/MM format
+    # Try parsing DD/MM format. Not cached, since the year depends on today.
     try:
         # Assumes DD/MM format and current year
         parsed_date = datetime.strptime(f"{date_str}/{datetime.now().year}", "%d/%m/%Y")
@@ -88,3 +109,14 @@ def parse_chilean_date(date_str: Optional[str]) -> Optional[datetime]:
 
     logger.warning(f"Could not parse date: '{date_str}'. Unknown format.")
     return None
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_full_date(date_str: str) -> Optional[datetime]:
+    """Parses a date that includes its year, or returns None."""
+    for fmt in _FULL_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
@@ -14,52 +15,72 @@ load_dotenv()
 BANKS_TO_SCRAPE = ["cl_santander", "cl_banco_chile", "cl_cencosud"]
 
 
+def scrape_bank(bank_id: str, user: str, password: str) -> None:
+    """Runs the scraper of one bank and saves its movements."""
+    logger.info(f"--- Starting process for: {bank_id} ---")
+
+    scraper = None
+    try:
+        # Get the scraper instance. Configuration (headless, debug)
+        # will be taken from .env file
+        scraper = get_scraper(bank_id, headless=False)
+
+        # Execute the scraper
+        movements = scraper.scrape(user=user, password=password)
+
+        if movements:
+            output_filename = f"outputs/{bank_id}_movements.xlsx"
+            save_to_xlsx(movements, output_filename)
+            logger.success(
+                f"Found and saved {len(movements)} movements for {bank_id} in '{output_filename}'."
+            )
+        else:
+            logger.info(f"No movements found for {bank_id}.")
+
+    except Exception as e:
+        logger.opt(exception=True).error(
+            "An error occurred while processing {}: {}", bank_id, e
+        )
+    finally:
+        # Each thread keeps its own browser; close it before the thread is reused.
+        if scraper is not None:
+            scraper.shutdown()
+
+
 def main():
     """
-    Main function that runs scrapers for all banks.
+    Main function that runs scrapers for all banks at the same time.
+
+    Scrapes mostly wait on the network, so running each bank on its own
+    thread takes about as long as the slowest bank instead of all of them.
 
     To run in visible mode (seeing the browser), make sure to have the
     following line in your .env file:
     SCRAPER_HEADLESS_MODE=false
     """
+    # Read every bank's credentials from the environment once, up front
+    credentials = {}
     for bank_id in BANKS_TO_SCRAPE:
-        logger.info(f"--- Starting process for: {bank_id} ---")
-
-        # Build environment variable names for credentials
-        user_env_var = f"{bank_id.upper()}_USER"
-        password_env_var = f"{bank_id.upper()}_PASSWORD"
-
-        # Get credentials from environment
-        user = os.getenv(user_env_var)
-        password = os.getenv(password_env_var)
-
+        user = os.getenv(f"{bank_id.upper()}_USER")
+        password = os.getenv(f"{bank_id.upper()}_PASSWORD")
         if not user or not password:
             logger.warning(
                 f"Credentials for {bank_id} not found in .env file. Skipping..."
             )
             continue
-
-        try:
-            # Get the scraper instance. Configuration (headless, debug)
-            # will be taken from .env file
-            scraper = get_scraper(bank_id, headless=False)
-
-            # Execute the scraper
-            movements = scraper.scrape(user=user, password=password)
-
-            if movements:
-                output_filename = f"outputs/{bank_id}_movements.xlsx"
-                save_to_xlsx(movements, output_filename)
-                logger.success(
-                    f"Found and saved {len(movements)} movements for {bank_id} in '{output_filename}'."
-                )
-            else:
-                logger.info(f"No movements found for {bank_id}.")
-
-        except Exception as e:
-            logger.error(
-                f"An error occurred while processing {bank_id}: {e}", exc_info=True
-            )
+        credentials[bank_id] = (user, password)
+
+    if not credentials:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(credentials)) as executor:
+        futures = [
+            executor.submit(scrape_bank, bank_id, user, password)
+            for bank_id, (user, password) in credentials.items()
+        ]
+        # Wait for every bank to finish.
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":